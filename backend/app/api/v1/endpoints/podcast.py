@@ -1,8 +1,13 @@
 """Podcast-related API endpoints."""
-from fastapi import APIRouter, HTTPException, Query
+from typing import AsyncGenerator
+
+from fastapi import APIRouter, HTTPException, Query, Request
+from sse_starlette.sse import EventSourceResponse
 
 from ....core.exceptions import RSSParseError
-from ....models.podcast import RSSParseResponse
+from ....models.podcast import DownloadJob, RSSParseResponse
+from ....services.feed_cache import feed_cache
+from ....services.job_service import TERMINAL_JOB_STATUSES, download_job_manager
 from ....services.podcast_service import parse_rss_feed
 
 router = APIRouter()
@@ -14,14 +19,15 @@ async def parse_rss_feed_endpoint(
     episode_index: int = Query(0, ge=0, description="Episode index to retrieve")
 ) -> RSSParseResponse:
     """Parse RSS feed and return podcast info with a single episode.
-    Automatically downloads the audio file to the media directory.
+    Returns immediately; the audio download and chunking run as a background
+    job whose id is included in the response.
 
     Args:
         url: The RSS feed URL to parse
         episode_index: The index of the episode to retrieve (default: 0)
 
     Returns:
-        RSSParseResponse: Podcast and episode information with download status
+        RSSParseResponse: Podcast and episode information with the download job id
 
     Raises:
         RSSParseError: When RSS feed is invalid or cannot be parsed
@@ -37,6 +43,68 @@ async def parse_rss_feed_endpoint(
         raise HTTPException(status_code=500, detail=f"Error parsing RSS feed: {str(e)}")
 
 
+@router.get("/jobs/{job_id}", response_model=DownloadJob)
+async def get_download_job(job_id: str) -> DownloadJob:
+    """Get the status of an audio download job.
+
+    Args:
+        job_id: Job id returned by /parse-rss
+
+    Returns:
+        DownloadJob: Job status with bytes downloaded and chunks ready
+
+    Raises:
+        HTTPException: When the job does not exist
+    """
+    job = download_job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job
+
+
+@router.get("/jobs/{job_id}/events")
+async def stream_download_job(job_id: str, request: Request):
+    """Stream progress of an audio download job.
+
+    Args:
+        job_id: Job id returned by /parse-rss
+        request: FastAPI request object for client disconnection detection
+
+    Returns:
+        Server-Sent Events stream of job snapshots, ending once the job is ready or failed
+
+    Raises:
+        HTTPException: When the job does not exist
+    """
+    if download_job_manager.get(job_id) is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+
+    async def generate_events() -> AsyncGenerator[dict, None]:
+        """Generate an SSE event for every job update."""
+        while not await request.is_disconnected():
+            # Grab the event before the snapshot so no update is missed
+            changed = download_job_manager.changed(job_id)
+            job = download_job_manager.get(job_id)
+            if job is None:
+                break
+            yield {"data": job.model_dump_json()}
+            if job.status in TERMINAL_JOB_STATUSES:
+                break
+            await changed.wait()
+
+    return EventSourceResponse(generate_events())
+
+
+@router.get("/stats")
+async def feed_cache_stats():
+    """Feed cache statistics endpoint.
+
+    Returns:
+        dict: Feed cache hit, miss and revalidation counters
+    """
+    return {"feed_cache": feed_cache.stats()}
+
+
 @router.get("/health")
 async def health_check():
     """Health check endpoint.
@@ -6,30 +6,61 @@ from fastapi import APIRouter, Request, Query
 from fastapi.responses import JSONResponse
 from sse_starlette.sse import EventSourceResponse
 
+from ....services.ffmpeg_scheduler import ffmpeg_scheduler
 from ....services.transcription_service import transcription_service
 
 router = APIRouter()
 
 
 @router.get("/info/{filename}")
-async def get_audio_info(filename: str):
+async def get_audio_info(
+    filename: str,
+    retry: bool = Query(False, description="Restart a preparation that failed")
+):
     """Get audio file metadata including chunk information.
+
+    Never waits for chunk preparation. If the episode is not prepared yet,
+    preparation runs in the background and a 202 with its progress is
+    returned; poll again after the Retry-After delay. A failed preparation
+    answers 422 until the client asks to retry.
     
     Args:
         filename: Name of the audio file in the media directory
+        retry: Start a new preparation if the last one failed
     
     Returns:
-        JSON with total_chunks, chunk_duration_seconds, total_duration_seconds
+        JSON with status, total_chunks, chunk_duration_seconds and
+        total_duration_seconds (202 responses carry the layout and
+        ready_chunks once they are known)
     """
-    info = transcription_service.get_audio_info(filename)
+    info = await transcription_service.get_audio_info(filename, retry=retry)
     if info is None:
         return JSONResponse(
             status_code=404,
             content={"error": f"Audio file {filename} not found"}
         )
+    if info["status"] == "failed":
+        return JSONResponse(status_code=422, content=info)
+    if info["status"] != "complete":
+        return JSONResponse(status_code=202, content=info, headers={"Retry-After": "1"})
     return info
 
 
+@router.get("/stats")
+async def get_transcription_stats():
+    """Get transcription coalescing counters and ffmpeg queue depth.
+
+    Returns:
+        JSON with single_flight hits (requests that joined an in-flight
+        transcription), misses (Whisper calls started) and in_flight, plus
+        ffmpeg running/queued process counts
+    """
+    return {
+        "single_flight": transcription_service.transcription_flights.stats(),
+        "ffmpeg": ffmpeg_scheduler.stats(),
+    }
+
+
 @router.get("/chunks/{filename}")
 async def transcribe_audio_chunks(
     filename: str, 
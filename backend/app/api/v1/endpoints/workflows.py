@@ -1,8 +1,15 @@
 """Research endpoint for LangGraph workflow."""
-from fastapi import APIRouter, HTTPException
+import json
+from typing import AsyncGenerator
+
+from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel
+from sse_starlette.sse import EventSourceResponse
 
-from app.workflows.src.research_graph.graph import graph
+from app.workflows.src.llm_cache import llm_cache
+from app.workflows.src.research_graph.graph import graph, map_reduce_graph
+from app.workflows.src.research_graph.limits import limiters
+from app.workflows.src.research_graph.search_cache import search_cache
 from app.workflows.src.notable_context_graph.graph import graph as notable_context_graph
 
 router = APIRouter()
@@ -20,10 +27,43 @@ async def research_statements(request: ResearchRequest):
     """Execute research workflow on provided statements."""
     try:
         result = await graph.ainvoke({"statements_to_research": request.statements_to_research})
-        return {"synthesized_results": result["synthesized_results"]}
+        return {
+            "synthesized_results": result["synthesized_results"],
+            "synthesis_timings": result["synthesis_timings"],
+        }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.post("/research/stream")
+async def research_statements_stream(request: ResearchRequest, http_request: Request):
+    """Execute research workflow and stream each verdict as soon as it completes.
+
+    Runs the per-statement map-reduce graph. Emits timestamped progress
+    events (routed, sources_returned) and one verdict event per statement,
+    followed by a completed event.
+    """
+
+    async def generate_events() -> AsyncGenerator[dict, None]:
+        """Generate SSE events from the graph's custom progress stream."""
+        try:
+            async for _, event in map_reduce_graph.astream(
+                {"statements_to_research": request.statements_to_research},
+                stream_mode="custom",
+                subgraphs=True,
+            ):
+                if await http_request.is_disconnected():
+                    break
+                yield {"data": json.dumps(event)}
+
+            if not await http_request.is_disconnected():
+                yield {"data": json.dumps({"event": "completed"})}
+
+        except Exception as e:
+            if not await http_request.is_disconnected():
+                yield {"data": json.dumps({"event": "error", "error": str(e)})}
+
+    return EventSourceResponse(generate_events())
+
 @router.post("/extract_notable_context")
 async def extract_notable_context(request: TranscriptChunk):
     """Execute notable context workflow on provided statements."""
@@ -31,4 +71,13 @@ async def extract_notable_context(request: TranscriptChunk):
         result = await notable_context_graph.ainvoke({"transcript": request.transcript})
         return {"notable_context": result["notable_context"]}
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/stats")
+async def workflow_stats():
+    """Report rate-limiter token levels and search and LLM cache hit rates."""
+    return {
+        "rate_limits": {name: limiter.stats() for name, limiter in limiters.items()},
+        "search_cache": search_cache.stats(),
+        "llm_cache": llm_cache.stats(),
+    }
@@ -12,6 +12,10 @@ load_dotenv()
 MEDIA_DIR = Path("media")
 MEDIA_DIR.mkdir(exist_ok=True)
 
+# Cache directory for data that is not served as media (feeds, search results)
+CACHE_DIR = Path(os.getenv("CACHE_DIR", "cache"))
+CACHE_DIR.mkdir(exist_ok=True)
+
 # Reusable HTTP client for better performance
 http_client = httpx.AsyncClient(
     follow_redirects=True,
@@ -22,6 +26,32 @@ http_client = httpx.AsyncClient(
 # Create settings object
 class Settings:
     MEDIA_DIR: Path = MEDIA_DIR
+    CACHE_DIR: Path = CACHE_DIR
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
+    # Maximum number of chunks transcribed concurrently per request
+    TRANSCRIPTION_MAX_CONCURRENCY: int = int(os.getenv("TRANSCRIPTION_MAX_CONCURRENCY", "4"))
+    # Connection pool and timeouts for the OpenAI (Whisper) client
+    OPENAI_MAX_CONNECTIONS: int = int(os.getenv("OPENAI_MAX_CONNECTIONS", "100"))
+    OPENAI_MAX_KEEPALIVE_CONNECTIONS: int = int(os.getenv("OPENAI_MAX_KEEPALIVE_CONNECTIONS", "20"))
+    OPENAI_TIMEOUT_SECONDS: float = float(os.getenv("OPENAI_TIMEOUT_SECONDS", "120"))
+    OPENAI_CONNECT_TIMEOUT_SECONDS: float = float(os.getenv("OPENAI_CONNECT_TIMEOUT_SECONDS", "10"))
+    # How long a transcription request waits for a chunk that is still being produced
+    CHUNK_READY_TIMEOUT_SECONDS: float = float(os.getenv("CHUNK_READY_TIMEOUT_SECONDS", "600"))
+    # Seconds a cached RSS feed is served without revalidating it
+    FEED_CACHE_TTL_SECONDS: float = float(os.getenv("FEED_CACHE_TTL_SECONDS", "60"))
+    # Worker threads used to parse downloaded RSS feeds
+    FEED_PARSE_WORKERS: int = int(os.getenv("FEED_PARSE_WORKERS", "4"))
+    # Largest episode download accepted, in bytes (default 1 GiB)
+    MAX_AUDIO_DOWNLOAD_BYTES: int = int(os.getenv("MAX_AUDIO_DOWNLOAD_BYTES", str(1024 * 1024 * 1024)))
+    # Block size used when streaming downloads to disk
+    DOWNLOAD_CHUNK_SIZE: int = int(os.getenv("DOWNLOAD_CHUNK_SIZE", str(1024 * 1024)))
+    # Seconds a finished (ready or failed) download job stays queryable
+    DOWNLOAD_JOB_TTL_SECONDS: float = float(os.getenv("DOWNLOAD_JOB_TTL_SECONDS", "3600"))
+    # Process-wide cap on concurrent background (bulk chunking) ffmpeg processes
+    FFMPEG_MAX_CONCURRENCY: int = int(os.getenv("FFMPEG_MAX_CONCURRENCY", str(max(1, (os.cpu_count() or 2) // 2))))
+    # Slots reserved for interactive work (ffprobe, chunk-0 passes), on top of the above
+    FFMPEG_MAX_INTERACTIVE_CONCURRENCY: int = int(os.getenv("FFMPEG_MAX_INTERACTIVE_CONCURRENCY", "2"))
+    # OS niceness applied to background (bulk chunking) ffmpeg processes
+    FFMPEG_BACKGROUND_NICENESS: int = int(os.getenv("FFMPEG_BACKGROUND_NICENESS", "10"))
 
 settings = Settings()
@@ -1,12 +1,27 @@
 """FastAPI application entry point."""
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
 from .api.v1.api import api_router
-from .core.config import settings
+from .core.config import http_client, settings
+from .services.transcription_service import transcription_service
+from .workflows.src.research_graph import http as research_http
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open pooled HTTP clients on startup and close them on shutdown."""
+    research_http.open_clients()
+    yield
+    await research_http.close_clients()
+    await transcription_service.client.close()
+    await http_client.aclose()
+
 
-app = FastAPI(title="Podcast Source Listener API", version="0.1.0")
+app = FastAPI(title="Podcast Source Listener API", version="0.1.0", lifespan=lifespan)
 
 # Add CORS middleware
 app.add_middleware(
@@ -1,6 +1,7 @@
 """Models package."""
 from .podcast import (
     AudioDownloadResponse,
+    DownloadJob,
     Episode,
     PodcastInfo,
     RSSParseResponse,
@@ -8,6 +9,7 @@ from .podcast import (
 
 __all__ = [
     "AudioDownloadResponse",
+    "DownloadJob",
     "Episode",
     "PodcastInfo",
     "RSSParseResponse",
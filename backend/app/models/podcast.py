@@ -23,7 +23,7 @@ class Episode(BaseModel):
 
 class AudioDownloadResponse(BaseModel):
     """Response model for audio download status."""
-    status: str  # "success", "error", "skipped"
+    status: str  # "success", "error", "skipped", "pending"
     file_path: Optional[str] = None
     filename: Optional[str] = None
     content_type: Optional[str] = None
@@ -31,9 +31,24 @@ class AudioDownloadResponse(BaseModel):
     error: Optional[str] = None
 
 
+class DownloadJob(BaseModel):
+    """Background download and chunking job for an episode's audio."""
+    job_id: str
+    audio_url: str
+    status: str  # "pending", "downloading", "chunking", "ready", "error"
+    bytes_downloaded: int = 0
+    total_bytes: Optional[int] = None
+    chunks_ready: int = 0
+    total_chunks: Optional[int] = None
+    audio_download: Optional[AudioDownloadResponse] = None
+    error: Optional[str] = None
+    updated_at: float
+
+
 class RSSParseResponse(BaseModel):
     """Response model for RSS feed parsing."""
     podcast: PodcastInfo
     episode: Episode
     total_episodes_in_feed: int
     audio_download: AudioDownloadResponse
+    job_id: Optional[str] = None
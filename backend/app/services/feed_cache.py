@@ -0,0 +1,187 @@
+"""RSS feed cache with conditional-GET revalidation and on-disk persistence."""
+import asyncio
+import hashlib
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+import aiofiles
+import aiofiles.os
+import feedparser
+import httpx
+from pydantic import BaseModel
+
+from ..core.config import http_client, settings
+from ..core.exceptions import RSSParseError
+from ..models.podcast import Episode, PodcastInfo
+from ..utils.singleflight import SingleFlight
+
+# Long-lived pool for feed parsing, shared by every request
+_parse_executor = ThreadPoolExecutor(
+    max_workers=settings.FEED_PARSE_WORKERS, thread_name_prefix="feed-parse"
+)
+
+
+class CachedFeed(BaseModel):
+    """Compact parsed representation of an RSS feed plus its HTTP validators."""
+    url: str
+    etag: Optional[str] = None
+    modified: Optional[str] = None
+    fetched_at: float
+    podcast: PodcastInfo
+    episodes: List[Episode]
+
+
+def _extract_podcast_info(feed, rss_url: str) -> PodcastInfo:
+    """Extract podcast information from parsed RSS feed."""
+    return PodcastInfo(
+        title=feed.feed.get("title", "Unknown Podcast"),
+        description=feed.feed.get("description", ""),
+        image_url=feed.feed.get("image", {}).get("href", ""),
+        rss_url=rss_url,
+    )
+
+
+def _extract_episode_info(entry, episode_index: int) -> Episode:
+    """Extract episode information from RSS entry."""
+    # Find audio URL from enclosures
+    audio_url = None
+    if hasattr(entry, 'enclosures') and entry.enclosures:
+        for enclosure in entry.enclosures:
+            if enclosure.type.startswith('audio/'):
+                audio_url = enclosure.href
+                break
+
+    return Episode(
+        title=entry.get("title", "Unknown Episode"),
+        description=entry.get("summary", ""),
+        audio_url=audio_url,
+        published_date=entry.get("published", ""),
+        duration=entry.get("itunes_duration", ""),
+        episode_index=episode_index,
+    )
+
+
+class FeedCache:
+    """Cache of parsed RSS feeds keyed by URL.
+
+    Feeds younger than ``settings.FEED_CACHE_TTL_SECONDS`` are served from
+    memory (hit). Older feeds are revalidated with ETag/Last-Modified, so an
+    unchanged feed costs a 304 (revalidate). Anything else is a full fetch
+    and parse (miss). Entries are persisted under ``CACHE_DIR/feeds`` so the
+    validators survive restarts.
+    """
+
+    def __init__(self):
+        """Start with an empty in-memory cache backed by ``CACHE_DIR/feeds``."""
+        self._feeds: Dict[str, CachedFeed] = {}
+        self._flights = SingleFlight()
+        self.cache_dir = settings.CACHE_DIR / "feeds"
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+
+    def _cache_path(self, url: str):
+        return self.cache_dir / f"{hashlib.sha256(url.encode()).hexdigest()}.json"
+
+    async def _load(self, url: str) -> Optional[CachedFeed]:
+        """Load a persisted feed from disk."""
+        try:
+            async with aiofiles.open(self._cache_path(url)) as f:
+                return CachedFeed.model_validate_json(await f.read())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Error reading cached feed for {url}: {e}")
+            return None
+
+    async def _store(self, cached: CachedFeed) -> None:
+        """Keep a feed in memory and persist it atomically."""
+        self._feeds[cached.url] = cached
+        cache_path = self._cache_path(cached.url)
+        temp_path = cache_path.with_suffix(f".json.{os.getpid()}.tmp")
+        try:
+            await aiofiles.os.makedirs(self.cache_dir, exist_ok=True)
+            async with aiofiles.open(temp_path, 'w') as f:
+                await f.write(cached.model_dump_json())
+            await aiofiles.os.replace(temp_path, cache_path)
+        except Exception as e:
+            print(f"Error persisting cached feed for {cached.url}: {e}")
+
+    async def get(self, url: str) -> CachedFeed:
+        """Return the parsed feed for ``url``, fetching or revalidating as needed.
+
+        Raises:
+            RSSParseError: When RSS feed is invalid or cannot be parsed
+        """
+        cached = self._feeds.get(url)
+        if cached and time.time() - cached.fetched_at < settings.FEED_CACHE_TTL_SECONDS:
+            self.hits += 1
+            return cached
+        # Concurrent requests for the same feed share one fetch
+        return await self._flights.do(url, lambda: self._refresh(url))
+
+    async def _refresh(self, url: str) -> CachedFeed:
+        cached = self._feeds.get(url) or await self._load(url)
+
+        headers = {}
+        if cached and cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached and cached.modified:
+            headers["If-Modified-Since"] = cached.modified
+
+        # Fetch over the shared pooled client (keep-alive, gzip/brotli, timeouts)
+        try:
+            response = await http_client.get(url, headers=headers)
+        except httpx.HTTPError as e:
+            raise RSSParseError(f"Could not fetch RSS feed: {e}")
+
+        if cached and response.status_code == 304:
+            self.revalidations += 1
+            cached = cached.model_copy(update={"fetched_at": time.time()})
+            await self._store(cached)
+            return cached
+
+        if response.status_code != 200:
+            raise RSSParseError(f"Could not fetch RSS feed: HTTP {response.status_code}")
+
+        # Only the CPU-bound byte parsing runs on the long-lived worker pool
+        loop = asyncio.get_running_loop()
+        feed = await loop.run_in_executor(
+            _parse_executor,
+            lambda: feedparser.parse(
+                response.content,
+                response_headers=dict(response.headers),
+            ),
+        )
+
+        if feed.bozo and not feed.entries:
+            raise RSSParseError("Invalid RSS feed URL or format")
+
+        self.misses += 1
+        cached = CachedFeed(
+            url=url,
+            etag=response.headers.get("etag"),
+            modified=response.headers.get("last-modified"),
+            fetched_at=time.time(),
+            podcast=_extract_podcast_info(feed, url),
+            episodes=[
+                _extract_episode_info(entry, index)
+                for index, entry in enumerate(feed.entries)
+            ],
+        )
+        await self._store(cached)
+        return cached
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss/revalidate counters and the number of feeds in memory."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "feeds": len(self._feeds),
+        }
+
+
+feed_cache = FeedCache()
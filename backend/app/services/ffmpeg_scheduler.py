@@ -0,0 +1,149 @@
+"""Process-wide scheduler for ffmpeg and ffprobe subprocesses."""
+import asyncio
+import os
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque, Dict
+
+from ..core.config import settings
+
+PRIORITY_INTERACTIVE = 0  # Someone is waiting on the result (probe, chunk 0)
+PRIORITY_BACKGROUND = 1  # Bulk chunking nobody is blocked on yet
+
+PRIORITY_NAMES = {PRIORITY_INTERACTIVE: "interactive", PRIORITY_BACKGROUND: "background"}
+
+
+class FFmpegScheduler:
+    """Global concurrency caps and queues for media subprocesses.
+
+    Interactive and background work draw from separate pools of slots, so
+    bulk chunking can never hold the slots that a probe or a chunk-0 pass
+    needs. Within a pool, requests wait in FIFO order and each finished
+    process hands its slot straight to the next waiter. A pass that starts
+    interactive can be demoted once its urgent output is out: it moves to
+    the background pool (which may briefly run over its cap) and frees its
+    interactive slot. Background processes run at a lower OS scheduling
+    priority so they do not starve the API.
+    """
+
+    def __init__(
+        self, max_interactive: int, max_background: int, background_niceness: int
+    ):
+        """Cap each pool's running processes and set the background niceness."""
+        self.limits = {
+            PRIORITY_INTERACTIVE: max(1, max_interactive),
+            PRIORITY_BACKGROUND: max(1, max_background),
+        }
+        self.background_niceness = background_niceness
+        self._running = {priority: 0 for priority in self.limits}
+        self._queues: Dict[int, Deque[asyncio.Future]] = {priority: deque() for priority in self.limits}
+        # Pool each running process currently counts against, keyed by pid
+        self._slots: Dict[int, int] = {}
+        self.started = 0
+        self.demoted = 0
+        self.max_queue_depth = 0
+        self.total_wait_seconds = 0.0
+
+    def _wake(self, priority: int) -> None:
+        """Hand free slots in a pool to its waiters."""
+        queue = self._queues[priority]
+        while queue and self._running[priority] < self.limits[priority]:
+            waiter = queue.popleft()
+            if not waiter.done():
+                self._running[priority] += 1
+                waiter.set_result(None)
+
+    async def _acquire(self, priority: int) -> None:
+        queue = self._queues[priority]
+        if self._running[priority] < self.limits[priority] and not queue:
+            self._running[priority] += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        queue.append(waiter)
+        self.max_queue_depth = max(self.max_queue_depth, sum(len(q) for q in self._queues.values()))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.cancelled():
+                # _wake may already have popped and skipped the waiter
+                if waiter in queue:
+                    queue.remove(waiter)
+            else:
+                # The slot was handed over just as we were cancelled; pass it on
+                self._release(priority)
+            raise
+
+    def _release(self, priority: int) -> None:
+        self._running[priority] -= 1
+        self._wake(priority)
+
+    def lower_priority(self, process: asyncio.subprocess.Process) -> None:
+        """Renice a running process to the background OS scheduling priority."""
+        if not hasattr(os, "setpriority"):
+            return
+        try:
+            os.setpriority(os.PRIO_PROCESS, process.pid, self.background_niceness)
+        except OSError as e:
+            print(f"Could not lower priority of process {process.pid}: {e}")
+
+    def demote(self, process: asyncio.subprocess.Process) -> None:
+        """Move a running interactive process to the background pool and renice it."""
+        if self._slots.get(process.pid) != PRIORITY_INTERACTIVE:
+            return
+        self._slots[process.pid] = PRIORITY_BACKGROUND
+        self._running[PRIORITY_BACKGROUND] += 1
+        self._release(PRIORITY_INTERACTIVE)
+        self.demoted += 1
+        self.lower_priority(process)
+
+    @asynccontextmanager
+    async def process(
+        self, *args: str, priority: int = PRIORITY_BACKGROUND, **kwargs
+    ) -> AsyncIterator[asyncio.subprocess.Process]:
+        """Wait for a slot, then run a subprocess for the duration of the block.
+
+        The process is killed if it is still running when the block exits.
+        """
+        queued_at = time.monotonic()
+        await self._acquire(priority)
+        self.total_wait_seconds += time.monotonic() - queued_at
+        self.started += 1
+        pool = priority
+        try:
+            process = await asyncio.create_subprocess_exec(*args, **kwargs)
+            self._slots[process.pid] = priority
+            if priority == PRIORITY_BACKGROUND:
+                self.lower_priority(process)
+            try:
+                yield process
+            finally:
+                if process.returncode is None:
+                    process.kill()
+                    await process.wait()
+                pool = self._slots.pop(process.pid, priority)
+        finally:
+            self._release(pool)
+
+    def stats(self) -> Dict:
+        """Return running and queued process counts per pool and queueing counters."""
+        stats = {}
+        for priority, name in PRIORITY_NAMES.items():
+            stats[f"max_{name}"] = self.limits[priority]
+            stats[f"running_{name}"] = self._running[priority]
+            stats[f"queued_{name}"] = sum(1 for waiter in self._queues[priority] if not waiter.done())
+        stats.update(
+            max_queue_depth=self.max_queue_depth,
+            started=self.started,
+            demoted=self.demoted,
+            avg_wait_seconds=round(self.total_wait_seconds / self.started, 3) if self.started else 0.0,
+        )
+        return stats
+
+
+ffmpeg_scheduler = FFmpegScheduler(
+    max_interactive=settings.FFMPEG_MAX_INTERACTIVE_CONCURRENCY,
+    max_background=settings.FFMPEG_MAX_CONCURRENCY,
+    background_niceness=settings.FFMPEG_BACKGROUND_NICENESS,
+)
@@ -0,0 +1,134 @@
+"""Background jobs that download episode audio and prepare its chunks."""
+import asyncio
+import time
+import uuid
+from typing import Dict, Optional
+
+from ..core.config import settings
+from ..models.podcast import DownloadJob
+from ..services.transcription_service import transcription_service
+
+TERMINAL_JOB_STATUSES = ("ready", "error")
+
+
+class DownloadJobManager:
+    """Registry of download jobs, one per audio URL.
+
+    Jobs move through pending -> downloading -> chunking -> ready (or error).
+    Every update replaces the job snapshot and fires its change event, which
+    lets status streams wake up without polling. Finished jobs are evicted
+    after ``settings.DOWNLOAD_JOB_TTL_SECONDS``.
+    """
+
+    def __init__(self):
+        """Start with no jobs."""
+        self._jobs: Dict[str, DownloadJob] = {}
+        self._jobs_by_url: Dict[str, str] = {}
+        self._changed: Dict[str, asyncio.Event] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def submit(self, audio_url: str) -> DownloadJob:
+        """Start a job for ``audio_url``, or return the existing one for that URL.
+
+        Failed jobs are replaced so a repeat request retries the download.
+        """
+        job_id = self._jobs_by_url.get(audio_url)
+        if job_id is not None:
+            if self._jobs[job_id].status != "error":
+                return self._jobs[job_id]
+            self._evict(job_id)
+
+        job = DownloadJob(
+            job_id=uuid.uuid4().hex,
+            audio_url=audio_url,
+            status="pending",
+            updated_at=time.time(),
+        )
+        self._jobs[job.job_id] = job
+        self._jobs_by_url[audio_url] = job.job_id
+        self._changed[job.job_id] = asyncio.Event()
+        self._tasks[job.job_id] = asyncio.create_task(self._run(job.job_id))
+        return job
+
+    def get(self, job_id: str) -> Optional[DownloadJob]:
+        """Return the current snapshot of a job."""
+        return self._jobs.get(job_id)
+
+    def changed(self, job_id: str) -> asyncio.Event:
+        """Return the event fired by the next update of a job (already set if it is gone)."""
+        event = self._changed.get(job_id)
+        if event is None:
+            event = asyncio.Event()
+            event.set()
+        return event
+
+    def _evict(self, job_id: str) -> None:
+        """Forget a job and wake anyone still waiting on it."""
+        job = self._jobs.pop(job_id, None)
+        if job is None:
+            return
+        if self._jobs_by_url.get(job.audio_url) == job_id:
+            del self._jobs_by_url[job.audio_url]
+        event = self._changed.pop(job_id, None)
+        if event is not None:
+            event.set()
+
+    def _update(self, job_id: str, **fields) -> None:
+        self._jobs[job_id] = self._jobs[job_id].model_copy(
+            update={**fields, "updated_at": time.time()}
+        )
+        event = self._changed[job_id]
+        self._changed[job_id] = asyncio.Event()
+        event.set()
+
+    async def _run(self, job_id: str) -> None:
+        from ..services.podcast_service import download_audio
+
+        job = self._jobs[job_id]
+        try:
+            self._update(job_id, status="downloading")
+            result = await download_audio(
+                job.audio_url,
+                on_progress=lambda done, total: self._update(
+                    job_id, bytes_downloaded=done, total_bytes=total
+                ),
+            )
+            if result.status != "success":
+                self._update(job_id, status="error", error=result.error, audio_download=result)
+                return
+
+            # download_audio returns once chunk 0 is ready; follow the rest
+            self._update(job_id, status="chunking", audio_download=result)
+            next_chunk = 0
+            while True:
+                metadata = await transcription_service.wait_for_chunk(result.filename, next_chunk)
+                if metadata is None:
+                    break
+                next_chunk = metadata.get("ready_chunks", metadata["total_chunks"])
+                self._update(
+                    job_id,
+                    chunks_ready=next_chunk,
+                    total_chunks=metadata["total_chunks"],
+                )
+                if next_chunk >= metadata["total_chunks"]:
+                    break
+
+            job = self._jobs[job_id]
+            metadata = await transcription_service.get_preparation_metadata(result.filename)
+            all_chunks_ready = job.total_chunks is not None and job.chunks_ready >= job.total_chunks
+            if all_chunks_ready or (metadata and metadata.get("status", "complete") == "complete"):
+                self._update(job_id, status="ready")
+            else:
+                self._update(job_id, status="error", error="Failed to prepare audio chunks")
+
+        except Exception as e:
+            self._update(job_id, status="error", error=str(e))
+
+        finally:
+            self._tasks.pop(job_id, None)
+            asyncio.get_running_loop().call_later(
+                settings.DOWNLOAD_JOB_TTL_SECONDS, self._evict, job_id
+            )
+
+
+download_job_manager = DownloadJobManager()
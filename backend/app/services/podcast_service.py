@@ -1,145 +1,161 @@
 """Podcast service containing business logic for podcast operations."""
-import asyncio
 import os
 import re
-from concurrent.futures import ThreadPoolExecutor
+import uuid
 from pathlib import Path
+from typing import Callable, Optional
 from urllib.parse import urlparse
 
 import aiofiles
 import aiofiles.os
-import feedparser
 
 from ..core.config import http_client, settings
-from ..models.podcast import AudioDownloadResponse, Episode, PodcastInfo, RSSParseResponse
+from ..models.podcast import AudioDownloadResponse, RSSParseResponse
 from ..utils.file_utils import create_safe_filename
+from ..services.feed_cache import feed_cache
+from ..services.job_service import download_job_manager
 from ..services.transcription_service import transcription_service
 
 
 async def parse_rss_feed(url: str, episode_index: int) -> RSSParseResponse:
     """Parse RSS feed and return podcast info with a single episode.
-    Automatically downloads the audio file to the media directory.
+    Starts (or attaches to) a background job that downloads the audio file
+    to the media directory and prepares its chunks.
 
     Args:
         url: The RSS feed URL to parse
         episode_index: The index of the episode to retrieve
 
     Returns:
-        RSSParseResponse: Podcast and episode information with download status
+        RSSParseResponse: Podcast and episode information with the download job id
 
     Raises:
         RSSParseError: When RSS feed is invalid or cannot be parsed
         HTTPException: When episode index is out of range
     """
-    from ..core.exceptions import RSSParseError
     from fastapi import HTTPException
 
-    # Run blocking RSS parsing in thread pool to avoid blocking event loop
-    loop = asyncio.get_event_loop()
-    with ThreadPoolExecutor() as executor:
-        feed = await loop.run_in_executor(executor, feedparser.parse, url)
+    # Cached feeds are revalidated with conditional requests
+    feed = await feed_cache.get(url)
 
-    if feed.bozo and not feed.entries:
-        raise RSSParseError("Invalid RSS feed URL or format")
-
-    if episode_index >= len(feed.entries):
+    if episode_index >= len(feed.episodes):
         raise HTTPException(
             status_code=404,
-            detail=f"Episode {episode_index} not found. Feed has {len(feed.entries)} episodes."
+            detail=f"Episode {episode_index} not found. Feed has {len(feed.episodes)} episodes."
         )
 
-    podcast_info = _extract_podcast_info(feed, url)
-    episode = _extract_episode_info(feed.entries[episode_index], episode_index)
-    download_result = await download_audio(episode.audio_url)
+    episode = feed.episodes[episode_index]
+
+    # Download and chunking continue in a background job the client can follow
+    job_id = None
+    if episode.audio_url:
+        job = download_job_manager.submit(episode.audio_url)
+        job_id = job.job_id
+        download_result = job.audio_download or AudioDownloadResponse(status="pending")
+    else:
+        download_result = AudioDownloadResponse(status="error", error="No audio URL found in RSS feed")
 
     return RSSParseResponse(
-        podcast=podcast_info,
+        podcast=feed.podcast,
         episode=episode,
-        total_episodes_in_feed=len(feed.entries),
-        audio_download=download_result
-    )
-
-
-def _extract_podcast_info(feed, rss_url: str) -> PodcastInfo:
-    """Extract podcast information from parsed RSS feed."""
-    return PodcastInfo(
-        title=feed.feed.get("title", "Unknown Podcast"),
-        description=feed.feed.get("description", ""),
-        image_url=feed.feed.get("image", {}).get("href", ""),
-        rss_url=rss_url,
+        total_episodes_in_feed=len(feed.episodes),
+        audio_download=download_result,
+        job_id=job_id
     )
 
 
-def _extract_episode_info(entry, episode_index: int) -> Episode:
-    """Extract episode information from RSS entry."""
-    # Find audio URL from enclosures
-    audio_url = None
-    if hasattr(entry, 'enclosures') and entry.enclosures:
-        for enclosure in entry.enclosures:
-            if enclosure.type.startswith('audio/'):
-                audio_url = enclosure.href
-                break
-
-    return Episode(
-        title=entry.get("title", "Unknown Episode"),
-        description=entry.get("summary", ""),
-        audio_url=audio_url,
-        published_date=entry.get("published", ""),
-        duration=entry.get("itunes_duration", ""),
-        episode_index=episode_index,
-    )
+async def download_audio(
+    audio_url: str,
+    on_progress: Optional[Callable[[int, Optional[int]], None]] = None
+) -> AudioDownloadResponse:
+    """Download audio file from URL and prepare chunks for transcription.
 
-
-async def download_audio(audio_url: str) -> AudioDownloadResponse:
-    """Download audio file from URL and prepare chunks for transcription."""
+    Args:
+        audio_url: The episode audio URL
+        on_progress: Called with (bytes_downloaded, total_bytes) after every block
+    """
     if not audio_url:
         return AudioDownloadResponse(status="error", error="No audio URL found in RSS feed")
 
+    temp_path = None
     try:
-        # Use shared HTTP client for connection reuse
-        response = await http_client.get(audio_url)
-
-        if response.status_code != 200:
-            return AudioDownloadResponse(
-                status="error",
-                error=f"HTTP {response.status_code}"
-            )
+        # Stream with the shared HTTP client so memory stays flat regardless of episode size
+        async with http_client.stream("GET", audio_url) as response:
+            if response.status_code != 200:
+                return AudioDownloadResponse(
+                    status="error",
+                    error=f"HTTP {response.status_code}"
+                )
+
+            # Validate headers before reading any of the body
+            content_type = response.headers.get('content-type', '').lower()
+            if not (content_type.startswith('audio/') or 'mp3' in content_type or 'mpeg' in content_type):
+                return AudioDownloadResponse(
+                    status="error",
+                    error=f"Invalid content type: {content_type}"
+                )
+
+            max_bytes = settings.MAX_AUDIO_DOWNLOAD_BYTES
+            content_length = response.headers.get('content-length')
+            total_bytes = int(content_length) if content_length and content_length.isdigit() else None
+            if total_bytes is not None and total_bytes > max_bytes:
+                return AudioDownloadResponse(
+                    status="error",
+                    error=f"Audio file too large: {content_length} bytes (max {max_bytes})"
+                )
+
+            filename = create_safe_filename(audio_url)
+            file_path = settings.MEDIA_DIR / filename
 
-        content_type = response.headers.get('content-type', '').lower()
-        if not (content_type.startswith('audio/') or 'mp3' in content_type or 'mpeg' in content_type):
+            # Handle duplicates with async file operations
+            counter = 1
+            original_filename = filename
+            while await aiofiles.os.path.exists(file_path):
+                name, ext = os.path.splitext(original_filename)
+                filename = f"{name}_{counter}{ext}"
+                file_path = settings.MEDIA_DIR / filename
+                counter += 1
+
+            # Write to a hidden temp file in MEDIA_DIR, then rename it into place
+            temp_path = settings.MEDIA_DIR / f".{filename}.{uuid.uuid4().hex}.part"
+            size_bytes = 0
+            async with aiofiles.open(temp_path, 'wb') as f:
+                async for block in response.aiter_bytes(settings.DOWNLOAD_CHUNK_SIZE):
+                    size_bytes += len(block)
+                    if size_bytes > max_bytes:
+                        return AudioDownloadResponse(
+                            status="error",
+                            error=f"Audio file too large: exceeded {max_bytes} bytes"
+                        )
+                    await f.write(block)
+                    if on_progress:
+                        on_progress(size_bytes, total_bytes)
+
+        await aiofiles.os.replace(temp_path, file_path)
+        temp_path = None
+
+        # Start chunking in the background and return once chunk 0 is ready
+        print(f"Preparing audio chunks for {filename}...")
+        transcription_service.start_chunk_preparation(filename)
+        if await transcription_service.wait_for_chunk(filename, 0) is None:
             return AudioDownloadResponse(
                 status="error",
-                error=f"Invalid content type: {content_type}"
+                error="Failed to prepare audio chunks"
             )
-
-        filename = create_safe_filename(audio_url)
-        file_path = settings.MEDIA_DIR / filename
-
-        # Handle duplicates with async file operations
-        counter = 1
-        original_filename = filename
-        while await aiofiles.os.path.exists(file_path):
-            name, ext = os.path.splitext(original_filename)
-            filename = f"{name}_{counter}{ext}"
-            file_path = settings.MEDIA_DIR / filename
-            counter += 1
-
-        async with aiofiles.open(file_path, 'wb') as f:
-            await f.write(response.content)
-
-        # Pre-chunk the audio file immediately after download
-        print(f"Preparing audio chunks for {filename}...")
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, transcription_service.prepare_audio_chunks, filename)
-        print(f"Audio chunks prepared for {filename}")
+        print(f"First audio chunk ready for {filename}")
 
         return AudioDownloadResponse(
             status="success",
             file_path=str(file_path),
             filename=filename,
             content_type=content_type,
-            size_bytes=len(response.content)
+            size_bytes=size_bytes
         )
 
     except Exception as e:
         return AudioDownloadResponse(status="error", error=str(e))
+
+    finally:
+        # Remove partial downloads left by errors or size limits
+        if temp_path is not None and await aiofiles.os.path.exists(temp_path):
+            await aiofiles.os.remove(temp_path)
@@ -2,57 +2,296 @@
 import asyncio
 import json
 import os
-import subprocess
-import tempfile
-from concurrent.futures import ThreadPoolExecutor
+import re
 from datetime import datetime
 from pathlib import Path
-from typing import AsyncGenerator, Dict, Optional
+from typing import AsyncGenerator, Callable, Dict, List, Optional, Set, Tuple
 
-from openai import OpenAI
-from pydub import AudioSegment
+import aiofiles
+import aiofiles.os
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 
 from ..core.config import settings
+from ..services.ffmpeg_scheduler import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE,
+    ffmpeg_scheduler,
+)
+from ..utils.file_lock import try_lock, unlock
+from ..utils.singleflight import SingleFlight
+
+# Segment names while ffmpeg is still writing them
+PARTIAL_CHUNK_NAME = re.compile(r"chunk_(\d+)\.mp3\.part")
+
+
+class ChunkPreparation:
+    """Progress of a chunk preparation running in this process.
+
+    Waiters block on the condition and are woken every time a new chunk is
+    published or the preparation finishes.
+    """
+
+    def __init__(self):
+        """Start with no metadata; it is published once the layout is known."""
+        self.metadata: Optional[Dict] = None
+        self.done = False
+        self.task: Optional[asyncio.Task] = None
+        self._changed = asyncio.Condition()
+
+    async def update(self, metadata: Optional[Dict] = None, done: bool = False) -> None:
+        """Publish new metadata and/or completion to all waiters."""
+        async with self._changed:
+            if metadata is not None:
+                self.metadata = dict(metadata)
+            self.done = self.done or done
+            self._changed.notify_all()
+
+    async def wait_until(self, predicate: Callable[[], bool]) -> None:
+        """Wait until ``predicate()`` holds."""
+        async with self._changed:
+            await self._changed.wait_for(predicate)
 
 
 class TranscriptionService:
     """Service for transcribing audio files using OpenAI Whisper API."""
 
     CHUNK_DURATION_MS = 2 * 60 * 1000  # 2 minutes
+    CHUNK_READY_POLL_SECONDS = 1.0  # Polling interval for preparations in other processes
+    CHUNK_DURATION_TOLERANCE_SECONDS = 1.0  # Shortfall at which a chunk on disk counts as corrupt
 
     def __init__(self):
-        self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
+        timeout = httpx.Timeout(
+            settings.OPENAI_TIMEOUT_SECONDS,
+            connect=settings.OPENAI_CONNECT_TIMEOUT_SECONDS
+        )
+        # Pooled async client so in-flight transcriptions are coroutines, not executor threads
+        self.client = AsyncOpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            timeout=timeout,
+            http_client=DefaultAsyncHttpxClient(
+                timeout=timeout,
+                limits=httpx.Limits(
+                    max_connections=settings.OPENAI_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.OPENAI_MAX_KEEPALIVE_CONNECTIONS
+                )
+            )
+        )
+        # Process-wide registry of in-flight chunk transcriptions
+        self.transcription_flights = SingleFlight()
+        # Chunk preparations running in this process, keyed by episode stem
+        self._preparations: Dict[str, ChunkPreparation] = {}
+        # Metadata of fully prepared episodes, keyed by episode stem
+        self._complete_metadata: Dict[str, Dict] = {}
+        # Error of the last failed preparation, keyed by episode stem
+        self._failed_preparations: Dict[str, str] = {}
 
-    def _get_audio_duration(self, audio_file_path: Path) -> Optional[float]:
+    async def _get_audio_duration(
+        self, audio_file_path: Path, priority: int = PRIORITY_INTERACTIVE
+    ) -> Optional[float]:
         """Get audio duration in seconds using ffprobe (fast, no loading into memory)."""
         try:
-            result = subprocess.run(
-                [
-                    "ffprobe", "-v", "error", "-show_entries", 
-                    "format=duration", "-of", "default=noprint_wrappers=1:nokey=1",
-                    str(audio_file_path)
-                ],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            return float(result.stdout.strip())
+            async with ffmpeg_scheduler.process(
+                "ffprobe", "-v", "error", "-show_entries",
+                "format=duration", "-of", "default=noprint_wrappers=1:nokey=1",
+                str(audio_file_path),
+                priority=priority,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            ) as process:
+                stdout, stderr = await process.communicate()
+            if process.returncode != 0:
+                raise RuntimeError(stderr.decode().strip())
+            return float(stdout.decode().strip())
         except Exception as e:
             print(f"Error getting audio duration with ffprobe: {e}")
             return None
 
-    def prepare_audio_chunks(self, filename: str) -> Optional[Dict]:
-        """Pre-chunk audio file using ffmpeg directly (fast, no memory loading).
+    async def _read_metadata(self, base_name: str) -> Optional[Dict]:
+        """Read an episode's metadata.json, or None if it is missing or unreadable."""
+        metadata_path = settings.MEDIA_DIR / base_name / "metadata.json"
+        try:
+            async with aiofiles.open(metadata_path, 'r') as f:
+                return json.loads(await f.read())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Error reading metadata {metadata_path}: {e}")
+            return None
+
+    async def _write_metadata(self, audio_dir: Path, metadata: Dict) -> None:
+        """Write metadata.json atomically so readers never see a partial file."""
+        metadata_path = audio_dir / "metadata.json"
+        temp_path = metadata_path.with_suffix(f".json.{os.getpid()}.tmp")
+        async with aiofiles.open(temp_path, 'w') as f:
+            await f.write(json.dumps(metadata, indent=2))
+        await aiofiles.os.replace(temp_path, metadata_path)
+
+    @staticmethod
+    def _is_complete(metadata: Optional[Dict]) -> bool:
+        """Check whether metadata describes a finished preparation (old files have no status)."""
+        return bool(metadata) and metadata.get("status", "complete") == "complete"
+
+    @staticmethod
+    def _chunk_ready(metadata: Optional[Dict], chunk_index: int) -> bool:
+        """Check the readiness index; metadata without one predates it and is complete."""
+        if not metadata:
+            return False
+        return chunk_index < metadata.get("ready_chunks", metadata["total_chunks"])
+
+    @staticmethod
+    def _contiguous_ready(valid: Set[int], total_chunks: int) -> int:
+        """Count the chunks ready from index 0 without a gap."""
+        return next((i for i in range(total_chunks) if i not in valid), total_chunks)
+
+    @staticmethod
+    def _missing_runs(valid: Set[int], total_chunks: int) -> List[Tuple[int, int]]:
+        """Group the chunks that still need cutting into [first, last) runs."""
+        runs = []
+        first = None
+        for i in range(total_chunks + 1):
+            missing = i < total_chunks and i not in valid
+            if missing and first is None:
+                first = i
+            elif not missing and first is not None:
+                runs.append((first, i))
+                first = None
+        return runs
+
+    async def _find_valid_chunks(
+        self, chunks_dir: Path, metadata: Dict, priority: int
+    ) -> Set[int]:
+        """Probe the chunks already on disk and keep those with the expected duration.
+
+        Only chunk 0 is probed at ``priority``; the rest run in the background
+        pool so a long episode cannot flood the interactive slots.
+        """
+        total_chunks = metadata["total_chunks"]
+        chunk_duration_sec = metadata["chunk_duration_seconds"]
+
+        async def check(i: int) -> Optional[int]:
+            chunk_path = chunks_dir / f"chunk_{i:03d}.mp3"
+            if not chunk_path.exists() or chunk_path.stat().st_size == 0:
+                return None
+            expected = min(
+                chunk_duration_sec,
+                metadata["total_duration_seconds"] - i * chunk_duration_sec
+            )
+            duration = await self._get_audio_duration(
+                chunk_path, priority if i == 0 else PRIORITY_BACKGROUND
+            )
+            if duration is None or duration < expected - self.CHUNK_DURATION_TOLERANCE_SECONDS:
+                print(f"Discarding corrupt chunk {chunk_path}")
+                return None
+            return i
+
+        results = await asyncio.gather(*(check(i) for i in range(total_chunks)))
+        return {i for i in results if i is not None}
+
+    async def _cut_chunks(
+        self,
+        audio_file_path: Path,
+        audio_dir: Path,
+        metadata: Dict,
+        first: int,
+        last: int,
+        valid: Set[int],
+        progress: Optional[ChunkPreparation],
+        priority: int
+    ) -> None:
+        """Cut chunks ``first`` to ``last - 1`` in a single ffmpeg pass.
+
+        Segments are written under a ``.part`` name and renamed once ffmpeg
+        closes them, so a chunk file is either complete or absent.
+        """
+        chunks_dir = audio_dir / "chunks"
+        chunk_duration_sec = metadata["chunk_duration_seconds"]
+
+        input_args = ["-i", str(audio_file_path)]
+        if first > 0:
+            input_args = ["-ss", str(first * chunk_duration_sec)] + input_args
+        if last < metadata["total_chunks"]:
+            input_args += ["-t", str((last - first) * chunk_duration_sec)]
+
+        # Decode the source once and let the segment muxer cut every chunk.
+        # The segment list on stdout names each chunk once it is closed.
+        # An interactive pass is demoted to the background pool (and OS
+        # priority) once its first chunk is out.
+        async with ffmpeg_scheduler.process(
+            "ffmpeg", "-y", "-v", "error",
+            *input_args,
+            "-map", "0:a",  # only audio stream
+            "-c:a", "libmp3lame",  # the .part names give ffmpeg no extension to pick an encoder from
+            "-ac", "1",  # mono
+            "-b:a", "64k",  # lower bitrate
+            "-f", "segment",
+            "-segment_time", str(chunk_duration_sec),
+            "-segment_start_number", str(first),
+            "-segment_format", "mp3",
+            "-reset_timestamps", "1",
+            "-segment_list", "pipe:1",
+            "-segment_list_type", "flat",
+            str(chunks_dir / "chunk_%03d.mp3.part"),
+            priority=priority,
+            stdout=asyncio.subprocess.PIPE
+        ) as process:
+            lowered = priority >= PRIORITY_BACKGROUND
+            async for line in process.stdout:
+                name = line.decode().strip()
+                match = PARTIAL_CHUNK_NAME.fullmatch(name)
+                if not match:
+                    continue
+                chunk_index = int(match.group(1))
+                if chunk_index >= last:
+                    # A rounding sliver past the run; never clobber a valid chunk
+                    await aiofiles.os.remove(chunks_dir / name)
+                    continue
+                await aiofiles.os.replace(
+                    chunks_dir / name, chunks_dir / f"chunk_{chunk_index:03d}.mp3"
+                )
+                if not lowered:
+                    ffmpeg_scheduler.demote(process)
+                    lowered = True
+                valid.add(chunk_index)
+                metadata["ready_chunks"] = self._contiguous_ready(valid, metadata["total_chunks"])
+                await self._write_metadata(audio_dir, metadata)
+                if progress:
+                    await progress.update(metadata)
+            await process.wait()
+
+        if process.returncode != 0:
+            raise RuntimeError(f"ffmpeg exited with code {process.returncode}")
+
+    async def prepare_audio_chunks(
+        self,
+        filename: str,
+        progress: Optional[ChunkPreparation] = None,
+        priority: int = PRIORITY_INTERACTIVE
+    ) -> Optional[Dict]:
+        """Pre-chunk audio file with ffmpeg segment passes (fast, no memory loading).
         
         Creates directory structure:
         media/
           audio.mp3              # Original file stays here
           audio/                 # Chunk directory
+            .prepare.lock
             metadata.json
             chunks/
               chunk_000.mp3
               chunk_001.mp3
               ...
+
+        metadata.json is written as soon as the duration is known and is
+        updated after every chunk: ``ready_chunks`` counts the chunks that
+        are complete on disk and ``status`` is ``preparing``, ``complete`` or
+        ``failed``. Each update is also published to ``progress``. ffprobe and
+        ffmpeg run through the global ``ffmpeg_scheduler`` at ``priority``.
+
+        Only the holder of the episode's lock file prepares chunks. Anyone
+        else (another request or uvicorn worker) follows the holder's
+        metadata, and takes over if the holder dies. An interrupted
+        preparation is resumed: chunks that are already valid are kept and
+        only missing or corrupt ones are cut again.
         
         Returns:
             Dict with total_chunks, chunk_duration_seconds, total_duration_seconds
@@ -61,154 +300,441 @@ class TranscriptionService:
         if not audio_file_path.exists():
             print(f"Audio file not found: {audio_file_path}")
             return None
-        
-        try:
-            # Create directory structure
-            base_name = audio_file_path.stem
-            audio_dir = settings.MEDIA_DIR / base_name
-            chunks_dir = audio_dir / "chunks"
-            chunks_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Get duration quickly without loading the file
-            print(f"Getting audio duration from {audio_file_path}")
-            total_duration_sec = self._get_audio_duration(audio_file_path)
-            if total_duration_sec is None:
+
+        base_name = audio_file_path.stem
+        audio_dir = settings.MEDIA_DIR / base_name
+        (audio_dir / "chunks").mkdir(parents=True, exist_ok=True)
+
+        followed = False
+        while True:
+            lock_fd = try_lock(audio_dir / ".prepare.lock")
+            if lock_fd is not None:
+                break
+            # Another process is preparing this episode; follow its progress.
+            # A failed status may predate a retry that holds the lock but has
+            # not rewritten metadata yet, so it is only final once the lock is free
+            followed = True
+            metadata = await self._read_metadata(base_name)
+            if metadata and progress:
+                await progress.update(metadata)
+            if self._is_complete(metadata):
+                return metadata
+            await asyncio.sleep(self.CHUNK_READY_POLL_SECONDS)
+
+        if followed:
+            metadata = await self._read_metadata(base_name)
+            if metadata and metadata.get("status") == "failed":
+                # The process we followed gave up; only an explicit retry starts over
+                unlock(lock_fd)
+                if progress:
+                    await progress.update(metadata)
                 return None
-            
-            total_duration_ms = int(total_duration_sec * 1000)
-            chunk_duration_sec = self.CHUNK_DURATION_MS / 1000
-            num_chunks = (total_duration_ms + self.CHUNK_DURATION_MS - 1) // self.CHUNK_DURATION_MS
-            
-            print(f"Splitting into {num_chunks} chunks using ffmpeg (parallel)...")
-            
-            # Define ffmpeg split function for parallel processing
-            def split_chunk(chunk_index: int) -> None:
-                """Split a single chunk using ffmpeg directly (fast)."""
-                start_sec = chunk_index * chunk_duration_sec
-                chunk_path = chunks_dir / f"chunk_{chunk_index:03d}.mp3"
-                
-                # Use ffmpeg to extract chunk directly from file
-                subprocess.run(
-                    [
-                        "ffmpeg", "-y", "-v", "error",
-                        "-ss", str(start_sec),
-                        "-t", str(chunk_duration_sec),
-                        "-i", str(audio_file_path),
-                        "-ac", "1",  # mono
-                        "-b:a", "64k",  # lower bitrate
-                        "-map", "0:a",  # only audio stream
-                        str(chunk_path)
-                    ],
-                    check=True
+
+        try:
+            return await self._prepare_locked(audio_file_path, audio_dir, progress, priority)
+        finally:
+            unlock(lock_fd)
+
+    async def _prepare_locked(
+        self,
+        audio_file_path: Path,
+        audio_dir: Path,
+        progress: Optional[ChunkPreparation],
+        priority: int
+    ) -> Optional[Dict]:
+        """Prepare (or resume preparing) chunks while holding the episode lock."""
+        filename = audio_file_path.name
+        chunks_dir = audio_dir / "chunks"
+        metadata = None
+        try:
+            existing = await self._read_metadata(audio_dir.name)
+            if existing and existing.get("status", "complete") == "complete":
+                # Finished by another process while we waited for the lock
+                return existing
+
+            resumable = bool(existing) and existing.get("chunk_duration_ms") == self.CHUNK_DURATION_MS
+            if existing:
+                # Announce this attempt before any probing, so followers do
+                # not mistake a stale failure for its outcome
+                metadata = {**existing, "status": "preparing"}
+                if not resumable:
+                    metadata["ready_chunks"] = 0
+                await self._write_metadata(audio_dir, metadata)
+
+            if resumable:
+                valid = await self._find_valid_chunks(chunks_dir, metadata, priority)
+                print(f"Resuming {filename}: {len(valid)}/{metadata['total_chunks']} chunks reusable")
+            else:
+                # Get duration quickly without loading the file
+                print(f"Getting audio duration from {audio_file_path}")
+                total_duration_sec = await self._get_audio_duration(audio_file_path)
+                if total_duration_sec is None:
+                    raise RuntimeError("ffprobe could not read the audio duration")
+
+                total_duration_ms = int(total_duration_sec * 1000)
+                num_chunks = (total_duration_ms + self.CHUNK_DURATION_MS - 1) // self.CHUNK_DURATION_MS
+                metadata = {
+                    "total_chunks": num_chunks,
+                    "chunk_duration_seconds": self.CHUNK_DURATION_MS / 1000,
+                    "total_duration_seconds": total_duration_sec,
+                    "chunk_duration_ms": self.CHUNK_DURATION_MS,
+                    "created_at": datetime.now().isoformat(),
+                    "status": "preparing"
+                }
+                valid = set()
+
+            # Drop segments left half-written by an interrupted pass
+            for partial in chunks_dir.glob("*.part"):
+                await aiofiles.os.remove(partial)
+
+            # Publish metadata up front so clients can start on chunk 0 right away
+            total_chunks = metadata["total_chunks"]
+            metadata["ready_chunks"] = self._contiguous_ready(valid, total_chunks)
+            await self._write_metadata(audio_dir, metadata)
+            if progress:
+                await progress.update(metadata)
+
+            for first, last in self._missing_runs(valid, total_chunks):
+                print(f"Cutting chunks {first}-{last - 1} of {filename} with ffmpeg...")
+                # Nobody is waiting on chunks past a ready chunk 0
+                run_priority = priority if first == 0 else PRIORITY_BACKGROUND
+                await self._cut_chunks(
+                    audio_file_path, audio_dir, metadata, first, last, valid, progress, run_priority
                 )
+
+            if len(valid) < total_chunks:
+                produced = metadata["ready_chunks"]
+                if produced == 0 or len(valid) != produced:
+                    raise RuntimeError(f"ffmpeg produced {len(valid)} of {total_chunks} chunks")
+                # Only a tail is missing after ffmpeg read the whole file: the
+                # ffprobe duration (an estimate for VBR files) overshot, so the
+                # chunks actually produced are all there is
+                print(f"Expected {total_chunks} chunks for {filename}, ffmpeg produced {produced}")
+                metadata["total_chunks"] = produced
+
+            metadata["status"] = "complete"
+            await self._write_metadata(audio_dir, metadata)
             
-            # Split chunks in parallel
-            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
-                list(executor.map(split_chunk, range(num_chunks)))
-            
-            # Create metadata
-            metadata = {
-                "total_chunks": num_chunks,
-                "chunk_duration_seconds": chunk_duration_sec,
-                "total_duration_seconds": total_duration_sec,
-                "chunk_duration_ms": self.CHUNK_DURATION_MS,
-                "created_at": datetime.now().isoformat()
-            }
-            
-            # Save metadata
-            metadata_path = audio_dir / "metadata.json"
-            with open(metadata_path, 'w') as f:
-                json.dump(metadata, f, indent=2)
-            
-            print(f"Successfully prepared {num_chunks} chunks for {filename}")
+            print(f"Successfully prepared {metadata['ready_chunks']} chunks for {filename}")
             return metadata
             
         except Exception as e:
             print(f"Error preparing chunks for {filename}: {e}")
+            if metadata is not None:
+                metadata["status"] = "failed"
+                try:
+                    await self._write_metadata(audio_dir, metadata)
+                except Exception:
+                    pass
             return None
 
-    async def transcribe_audio_chunk(self, audio_chunk: AudioSegment, model: str = "whisper-1") -> Optional[object]:
-        """Transcribe an audio chunk using OpenAI Whisper API with timestamps."""
-        def _transcribe():
-            with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as temp_file:
-                audio_chunk.export(temp_file.name, format="mp3")
-                with open(temp_file.name, "rb") as audio_file:
-                    return self.client.audio.transcriptions.create(
-                        file=audio_file,
-                        model=model,
-                        response_format="verbose_json",
-                        timestamp_granularities=["segment"]
+    def start_chunk_preparation(
+        self, filename: str, priority: int = PRIORITY_INTERACTIVE
+    ) -> ChunkPreparation:
+        """Start preparing chunks in the background, or return the preparation already running."""
+        base_name = Path(filename).stem
+        preparation = self._preparations.get(base_name)
+        if preparation is not None:
+            return preparation
+
+        preparation = ChunkPreparation()
+        self._preparations[base_name] = preparation
+
+        async def run() -> None:
+            try:
+                metadata = await self.prepare_audio_chunks(filename, preparation, priority)
+                if self._is_complete(metadata):
+                    self._complete_metadata[base_name] = metadata
+                    self._failed_preparations.pop(base_name, None)
+                else:
+                    self._failed_preparations[base_name] = f"Failed to prepare audio chunks for {filename}"
+            finally:
+                self._preparations.pop(base_name, None)
+                await preparation.update(done=True)
+
+        preparation.task = asyncio.create_task(run())
+        return preparation
+
+    async def get_chunk_metadata(self, filename: str) -> Optional[Dict]:
+        """Return chunk metadata, starting preparation if needed.
+
+        Returns as soon as the chunk layout is known; chunks may still be in
+        progress (see ``wait_for_chunk``).
+        """
+        base_name = Path(filename).stem
+        if base_name in self._complete_metadata:
+            return self._complete_metadata[base_name]
+        preparation = self._preparations.get(base_name)
+        if preparation is None:
+            metadata = await self._read_metadata(base_name)
+            if self._is_complete(metadata):
+                self._complete_metadata[base_name] = metadata
+                return metadata
+            if metadata and metadata.get("status") == "preparing":
+                # Prepared elsewhere: follow it here, taking over if that process died
+                self.start_chunk_preparation(filename)
+                return metadata
+            print(f"Metadata not found for {filename}, preparing chunks...")
+            preparation = self.start_chunk_preparation(filename)
+
+        await preparation.wait_until(lambda: preparation.metadata is not None or preparation.done)
+        return preparation.metadata
+
+    async def get_preparation_metadata(self, filename: str) -> Optional[Dict]:
+        """Return the latest known chunk metadata without starting a preparation."""
+        base_name = Path(filename).stem
+        preparation = self._preparations.get(base_name)
+        if preparation is not None and preparation.metadata is not None:
+            return preparation.metadata
+        return await self._read_metadata(base_name)
+
+    async def wait_for_chunk(self, filename: str, chunk_index: int) -> Optional[Dict]:
+        """Wait until a chunk is on disk and return the metadata that covers it.
+
+        Follows in-process preparations directly. A preparation running in
+        another process is followed through a local preparation, which polls
+        its metadata.json and takes over if that process dies. Returns None
+        if the chunk does not become ready within
+        ``settings.CHUNK_READY_TIMEOUT_SECONDS``.
+        """
+        base_name = Path(filename).stem
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + settings.CHUNK_READY_TIMEOUT_SECONDS
+
+        while True:
+            preparation = self._preparations.get(base_name)
+            if preparation is not None:
+                try:
+                    await asyncio.wait_for(
+                        preparation.wait_until(
+                            lambda: preparation.done
+                            or self._chunk_ready(preparation.metadata, chunk_index)
+                        ),
+                        timeout=max(0.0, deadline - loop.time())
                     )
+                except TimeoutError:
+                    return None
+                if self._chunk_ready(preparation.metadata, chunk_index):
+                    return preparation.metadata
+
+            metadata = await self._read_metadata(base_name)
+            if self._chunk_ready(metadata, chunk_index):
+                return metadata
+            if metadata is None or metadata.get("status") != "preparing":
+                return None
+            if loop.time() >= deadline:
+                return None
+            if preparation is None:
+                self.start_chunk_preparation(filename)
+            else:
+                await asyncio.sleep(self.CHUNK_READY_POLL_SECONDS)
 
+    async def transcribe_audio_chunk(self, chunk_path: Path, model: str = "whisper-1") -> Optional[object]:
+        """Transcribe an encoded chunk file using OpenAI Whisper API with timestamps.
+
+        The file is uploaded as-is; the client reads it off the event loop.
+        """
         try:
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(None, _transcribe)
-            return result
+            return await self.client.audio.transcriptions.create(
+                file=chunk_path,
+                model=model,
+                response_format="verbose_json",
+                timestamp_granularities=["segment"]
+            )
         except Exception as e:
             print(f"Error transcribing chunk: {e}")
             return None
 
-    def get_audio_info(self, filename: str) -> Optional[Dict]:
-        """Get audio file metadata including chunk information.
+    @staticmethod
+    def _audio_info(metadata: Dict) -> Dict:
+        """Chunk layout fields exposed by the info endpoint."""
+        return {
+            "total_chunks": metadata["total_chunks"],
+            "chunk_duration_seconds": metadata["chunk_duration_seconds"],
+            "total_duration_seconds": metadata["total_duration_seconds"]
+        }
+
+    async def get_audio_info(self, filename: str, retry: bool = False) -> Optional[Dict]:
+        """Get audio file metadata including chunk information, without waiting.
         
-        Reads from cached metadata.json if available, otherwise prepares chunks first.
+        Prepared episodes are answered from memory (after one metadata.json
+        read per process) with ``status: complete``. Otherwise chunk
+        preparation is started or joined in the background and its progress
+        is returned with ``status: preparing``; the chunk layout is included
+        once ffprobe has measured the file.
+
+        A failed preparation is reported with ``status: failed`` and is only
+        started again when ``retry`` is set.
+
+        Returns:
+            Info dict, or None if the audio file does not exist
         """
-        # Check for cached metadata first
         base_name = Path(filename).stem
-        audio_dir = settings.MEDIA_DIR / base_name
-        metadata_path = audio_dir / "metadata.json"
-        
-        if metadata_path.exists():
-            try:
-                with open(metadata_path, 'r') as f:
-                    metadata = json.load(f)
-                return {
-                    "total_chunks": metadata["total_chunks"],
-                    "chunk_duration_seconds": metadata["chunk_duration_seconds"],
-                    "total_duration_seconds": metadata["total_duration_seconds"]
+        metadata = self._complete_metadata.get(base_name)
+        if metadata is None and base_name not in self._preparations:
+            on_disk = await self._read_metadata(base_name)
+            if self._is_complete(on_disk):
+                metadata = self._complete_metadata[base_name] = on_disk
+            elif not retry:
+                error = self._failed_preparations.get(base_name)
+                if error is None and on_disk and on_disk.get("status") == "failed":
+                    error = f"Failed to prepare audio chunks for {filename}"
+                if error is not None:
+                    return {"status": "failed", "error": error}
+        if metadata is not None:
+            return {**self._audio_info(metadata), "status": "complete"}
+
+        if not await aiofiles.os.path.exists(settings.MEDIA_DIR / filename):
+            return None
+
+        self._failed_preparations.pop(base_name, None)
+        preparation = self.start_chunk_preparation(filename)
+        progress = {"status": "preparing"}
+        if preparation.metadata is not None:
+            progress.update(
+                self._audio_info(preparation.metadata),
+                ready_chunks=preparation.metadata.get("ready_chunks", 0)
+            )
+        return progress
+
+    @staticmethod
+    def _chunking_key(metadata: Dict) -> str:
+        """Fingerprint of the chunk layout that cached transcripts belong to."""
+        return "{}:{}:{}".format(
+            metadata.get("chunk_duration_ms"),
+            metadata.get("total_chunks"),
+            metadata.get("created_at")
+        )
+
+    @staticmethod
+    def _build_chunk_event(
+        chunk_index: int,
+        total_chunks: int,
+        chunk_duration_sec: int,
+        transcript: Dict
+    ) -> Dict:
+        """Build the SSE payload for a chunk from its chunk-relative transcript."""
+        time_offset = chunk_index * chunk_duration_sec
+        return {
+            "chunk_index": chunk_index + 1,
+            "total_chunks": total_chunks,
+            "text": transcript["text"],
+            "segments": [
+                {
+                    "start": segment["start"] + time_offset,
+                    "end": segment["end"] + time_offset,
+                    "text": segment["text"]
                 }
-            except Exception as e:
-                print(f"Error reading cached metadata: {e}")
-        
-        # Fallback: prepare chunks if metadata doesn't exist
-        print(f"Metadata not found for {filename}, preparing chunks...")
-        metadata = self.prepare_audio_chunks(filename)
-        if metadata:
+                for segment in transcript["segments"]
+            ]
+        }
+
+    async def _load_cached_transcript(
+        self, audio_dir: Path, chunk_index: int, chunking_key: str
+    ) -> Optional[Dict]:
+        """Read a chunk transcript from disk if it matches the current chunking."""
+        transcript_path = audio_dir / "transcripts" / f"chunk_{chunk_index:03d}.json"
+        try:
+            async with aiofiles.open(transcript_path, 'r') as f:
+                cached = json.loads(await f.read())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Error reading cached transcript {transcript_path}: {e}")
+            return None
+
+        if cached.get("chunking") != chunking_key:
+            return None
+        return cached
+
+    async def _save_cached_transcript(
+        self, audio_dir: Path, chunk_index: int, chunking_key: str, transcript: Dict
+    ) -> None:
+        """Persist a chunk transcript next to the chunk files (atomic replace)."""
+        transcripts_dir = audio_dir / "transcripts"
+        transcript_path = transcripts_dir / f"chunk_{chunk_index:03d}.json"
+        temp_path = transcript_path.with_suffix(f".json.{os.getpid()}.tmp")
+        try:
+            await aiofiles.os.makedirs(transcripts_dir, exist_ok=True)
+            async with aiofiles.open(temp_path, 'w') as f:
+                await f.write(json.dumps({"chunking": chunking_key, **transcript}))
+            await aiofiles.os.replace(temp_path, transcript_path)
+        except Exception as e:
+            print(f"Error caching transcript {transcript_path}: {e}")
+
+    async def _transcribe_chunk_file(
+        self,
+        audio_dir: Path,
+        chunk_index: int,
+        total_chunks: int,
+        chunk_duration_sec: int,
+        chunking_key: str
+    ) -> Dict:
+        """Transcribe a single pre-chunked file, cache it and build its result event."""
+        i = chunk_index
+        chunk_path = audio_dir / "chunks" / f"chunk_{i:03d}.mp3"
+
+        if not chunk_path.exists():
             return {
-                "total_chunks": metadata["total_chunks"],
-                "chunk_duration_seconds": metadata["chunk_duration_seconds"],
-                "total_duration_seconds": metadata["total_duration_seconds"]
+                "chunk_index": i + 1,
+                "total_chunks": total_chunks,
+                "error": f"Chunk file not found: {chunk_path}"
+            }
+
+        try:
+            print(f"Transcribing chunk {i+1}/{total_chunks} from {chunk_path.name}...")
+            transcription = await self.transcribe_audio_chunk(chunk_path)
+
+            if transcription:
+                transcript = {
+                    "text": transcription.text,
+                    "segments": [
+                        {
+                            "start": segment.start,
+                            "end": segment.end,
+                            "text": segment.text
+                        }
+                        for segment in getattr(transcription, 'segments', None) or []
+                    ]
+                }
+                await self._save_cached_transcript(audio_dir, i, chunking_key, transcript)
+                return self._build_chunk_event(i, total_chunks, chunk_duration_sec, transcript)
+
+            return {
+                "chunk_index": i + 1,
+                "total_chunks": total_chunks,
+                "error": f"Failed to transcribe chunk {i+1}"
+            }
+        except Exception as e:
+            return {
+                "chunk_index": i + 1,
+                "total_chunks": total_chunks,
+                "error": f"Error transcribing chunk {i+1}: {e}"
             }
-        
-        return None
 
     async def transcribe_specific_chunks(
         self, 
         filename: str, 
         start_chunk: int, 
-        end_chunk: int
+        end_chunk: int,
+        max_concurrency: Optional[int] = None
     ) -> AsyncGenerator[Dict, None]:
-        """Transcribe specific chunk range from an audio file using pre-chunked files."""
+        """Transcribe specific chunk range from an audio file using pre-chunked files.
+
+        Up to ``max_concurrency`` chunks (default
+        ``settings.TRANSCRIPTION_MAX_CONCURRENCY``) are transcribed at once,
+        started in chunk order so the first chunk is never queued behind
+        later ones. Results are still yielded in chunk order, each as soon as it and every
+        earlier chunk in the range have finished.
+        """
         base_name = Path(filename).stem
         audio_dir = settings.MEDIA_DIR / base_name
-        chunks_dir = audio_dir / "chunks"
-        metadata_path = audio_dir / "metadata.json"
         
-        # Check if chunks exist, if not prepare them
-        if not metadata_path.exists() or not chunks_dir.exists():
-            print(f"Chunks not found for {filename}, preparing...")
-            metadata = self.prepare_audio_chunks(filename)
-            if not metadata:
-                yield {"error": "Failed to prepare audio chunks"}
-                return
-        else:
-            # Load metadata
-            try:
-                with open(metadata_path, 'r') as f:
-                    metadata = json.load(f)
-            except Exception as e:
-                yield {"error": f"Failed to read metadata: {e}"}
-                return
+        # Load metadata, starting preparation if chunks don't exist yet
+        metadata = await self.get_chunk_metadata(filename)
+        if not metadata:
+            yield {"error": "Failed to prepare audio chunks"}
+            return
         
         total_chunks = metadata["total_chunks"]
         chunk_duration_sec = int(metadata["chunk_duration_seconds"])
@@ -220,53 +746,56 @@ class TranscriptionService:
             yield {"error": f"Invalid chunk range: {start_chunk}-{end_chunk} (total: {total_chunks})"}
             return
 
-        # Transcribe only the requested chunk range by loading individual chunk files
-        for i in range(start_chunk, end_chunk + 1):
-            chunk_path = chunks_dir / f"chunk_{i:03d}.mp3"
-            
-            if not chunk_path.exists():
-                yield {
-                    "chunk_index": i + 1,
-                    "total_chunks": total_chunks,
-                    "error": f"Chunk file not found: {chunk_path}"
-                }
-                continue
-            
-            # Load individual chunk file
-            try:
-                audio_chunk = AudioSegment.from_file(chunk_path)
-                print(f"Transcribing chunk {i+1}/{total_chunks} from {chunk_path.name}...")
-                transcription = await self.transcribe_audio_chunk(audio_chunk)
+        limit = max_concurrency or settings.TRANSCRIPTION_MAX_CONCURRENCY
 
-                if transcription:
-                    time_offset = i * chunk_duration_sec
-                    segments = [
-                        {
-                            "start": segment.start + time_offset,
-                            "end": segment.end + time_offset,
-                            "text": segment.text
-                        }
-                        for segment in getattr(transcription, 'segments', [])
-                    ]
+        chunking_key = self._chunking_key(metadata)
 
-                    yield {
-                        "chunk_index": i + 1,
-                        "total_chunks": total_chunks,
-                        "text": transcription.text,
-                        "segments": segments
-                    }
-                else:
-                    yield {
-                        "chunk_index": i + 1,
-                        "total_chunks": total_chunks,
-                        "error": f"Failed to transcribe chunk {i+1}"
-                    }
-            except Exception as e:
-                yield {
-                    "chunk_index": i + 1,
+        async def transcribe_chunk(chunk_index: int) -> Dict:
+            # Cached transcripts are served from disk without calling Whisper
+            cached = await self._load_cached_transcript(audio_dir, chunk_index, chunking_key)
+            if cached is not None:
+                return self._build_chunk_event(
+                    chunk_index, total_chunks, chunk_duration_sec, cached
+                )
+            # Chunks may still be produced by a running preparation
+            if await self.wait_for_chunk(filename, chunk_index) is None:
+                return {
+                    "chunk_index": chunk_index + 1,
                     "total_chunks": total_chunks,
-                    "error": f"Error loading chunk {i+1}: {e}"
+                    "error": f"Chunk {chunk_index + 1} is not available"
                 }
+            # Identical concurrent requests share one Whisper call
+            return await self.transcription_flights.do(
+                (base_name, chunk_index, chunking_key),
+                lambda: self._transcribe_chunk_file(
+                    audio_dir, chunk_index, total_chunks, chunk_duration_sec, chunking_key
+                )
+            )
+
+        chunk_indices = range(start_chunk, end_chunk + 1)
+        loop = asyncio.get_running_loop()
+        results = {i: loop.create_future() for i in chunk_indices}
+        pending = iter(chunk_indices)
 
+        async def worker() -> None:
+            # Workers take the next chunk in order before any await, so a slot
+            # always goes to the earliest chunk nobody has started yet
+            for chunk_index in pending:
+                try:
+                    results[chunk_index].set_result(await transcribe_chunk(chunk_index))
+                except Exception as e:
+                    results[chunk_index].set_exception(e)
+
+        workers = [
+            asyncio.create_task(worker())
+            for _ in range(min(max(1, limit), len(chunk_indices)))
+        ]
+        try:
+            for chunk_index in chunk_indices:
+                yield await results[chunk_index]
+        finally:
+            # Client went away or the stream was closed early
+            for task in workers:
+                task.cancel()
 
 transcription_service = TranscriptionService()
@@ -0,0 +1,36 @@
+"""Advisory file locks shared between processes."""
+import os
+from pathlib import Path
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: only in-process coordination is available
+    fcntl = None
+
+
+def try_lock(path: Path) -> Optional[int]:
+    """Take an exclusive lock on ``path`` without blocking.
+
+    Returns the file descriptor holding the lock, or None if another process
+    holds it. The lock is released by ``unlock`` or when the holder exits,
+    so a crashed holder never leaves it stuck.
+    """
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    if fcntl is None:
+        return fd
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        os.close(fd)
+        return None
+    return fd
+
+
+def unlock(fd: int) -> None:
+    """Release a lock taken with ``try_lock``."""
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
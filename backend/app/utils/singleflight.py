@@ -0,0 +1,45 @@
+"""Coalescing of identical concurrent async calls."""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """Run at most one call per key at a time and share its result with all callers.
+
+    The shared call runs in its own task and every caller awaits it through
+    ``asyncio.shield``, so a caller that is cancelled (e.g. an SSE client that
+    disconnects) stops waiting without cancelling the work others depend on.
+    """
+
+    def __init__(self):
+        """Start with no calls in flight."""
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Await ``func()`` for ``key``, joining an identical call if one is running."""
+        task = self._in_flight.get(key)
+        if task is None:
+            self.misses += 1
+            task = asyncio.create_task(func())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._forget(key, task))
+        else:
+            self.hits += 1
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Mark the exception as retrieved in case every caller has gone away
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and the number of calls currently in flight."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "in_flight": len(self._in_flight),
+        }
@@ -0,0 +1,86 @@
+"""Content-addressed response cache shared by the workflow ChatXAI models.
+
+LangChain hands the cache the serialized prompt plus an ``llm_string`` that
+encodes the model name, temperature and any bound tools (which is where a
+structured-output schema lives). Entries are keyed by a hash of both, so a
+repeated call with the same model, temperature, prompt and schema is served
+without contacting xAI.
+"""
+
+import hashlib
+import os
+from collections import OrderedDict
+from typing import Any, Optional, Union
+
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "512"))
+
+
+class LLMResponseCache(BaseCache):
+    """Bounded in-memory LRU cache of LLM generations."""
+
+    def __init__(self, maxsize: int):
+        """Keep at most ``maxsize`` generations."""
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, RETURN_VAL_TYPE] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(prompt: str, llm_string: str) -> str:
+        return hashlib.sha256(f"{llm_string}\0{prompt}".encode()).hexdigest()
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        """Look up a cached generation."""
+        key = self._key(prompt, llm_string)
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        """Store a generation, evicting the least recently used entries."""
+        key = self._key(prompt, llm_string)
+        self._entries[key] = return_val
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self, **kwargs: Any) -> None:
+        """Drop every cached generation."""
+        self._entries.clear()
+
+    # The cache is in memory, so skip the default executor hop
+    async def alookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        """Look up a cached generation."""
+        return self.lookup(prompt, llm_string)
+
+    async def aupdate(
+        self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE
+    ) -> None:
+        """Store a generation, evicting the least recently used entries."""
+        self.update(prompt, llm_string, return_val)
+
+    async def aclear(self, **kwargs: Any) -> None:
+        """Drop every cached generation."""
+        self.clear(**kwargs)
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss counters and the current number of entries."""
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+
+llm_cache = LLMResponseCache(maxsize=LLM_CACHE_MAX_ENTRIES)
+
+
+def model_cache(enabled: bool = True) -> Union[BaseCache, bool]:
+    """Return the ``cache`` argument for a ChatXAI model.
+
+    Pass ``enabled=False`` at a call site to opt that model out of caching.
+    """
+    return llm_cache if enabled and LLM_CACHE_ENABLED else False
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from typing import Any, Dict, TypedDict
 
@@ -9,10 +10,13 @@ from pydantic import BaseModel, Field
 
 import os
 from dotenv import load_dotenv
+
+from app.workflows.src.llm_cache import model_cache
+
 load_dotenv()
 
 
-def _extract_notable_context(state: dict) -> dict:
+async def _extract_notable_context(state: dict) -> dict:
     transcript = state["transcript"]
     """Extract only high-value statements worthy of research.
     
@@ -56,7 +60,9 @@ Transcript:
 
 Remember: Quality over quantity. Extract 0-5 questions maximum. If nothing meets the strict criteria, return an empty list."""
 
-    result: NotableStatements = llm.invoke(prompt)
+    # Await the LLM so the event loop keeps serving other requests meanwhile
+    async with _extraction_semaphore:
+        result: NotableStatements = await llm.ainvoke(prompt)
     return {
         "notable_context": result.statements
     }
@@ -102,13 +108,19 @@ class State:
 llm = ChatXAI(
     model="grok-4-fast-non-reasoning",
     api_key=os.getenv("XAI_API_KEY"),
-    temperature=0
+    temperature=0,
+    cache=model_cache(),
 ).with_structured_output(NotableStatements)
 
+# Cap on concurrent extraction calls to the LLM
+_extraction_semaphore = asyncio.Semaphore(
+    int(os.getenv("NOTABLE_CONTEXT_MAX_CONCURRENCY", "4"))
+)
+
 # Nodes
-def extract_notable_context(state: State) -> Dict[str, Any]:
+async def extract_notable_context(state: State) -> Dict[str, Any]:
     """Extract notable context from transcript."""
-    result = _extract_notable_context({"transcript": state.transcript})
+    result = await _extract_notable_context({"transcript": state.transcript})
     return result
 
 
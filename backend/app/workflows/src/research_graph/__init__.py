@@ -1,6 +1,6 @@
 """Research graph package."""
 
-from app.workflows.src.research_graph.graph import graph
+from app.workflows.src.research_graph.graph import graph, map_reduce_graph
 
-__all__ = ["graph"]
+__all__ = ["graph", "map_reduce_graph"]
 
@@ -5,13 +5,21 @@ Routes queries to appropriate search sources: Brave, arXiv, Congress.gov
 
 from __future__ import annotations
 
+import asyncio
 import os
+import time
 from typing import Any, Dict
 
+from langgraph.config import get_stream_writer
 from langgraph.graph import StateGraph
+from langgraph.types import Send
 
-from app.workflows.src.research_graph.models import State
-from app.workflows.src.research_graph.router import route_statement
+from app.workflows.src.research_graph.models import (
+    MapReduceState,
+    State,
+    StatementState,
+)
+from app.workflows.src.research_graph.router import route_statement, route_statements
 from app.workflows.src.research_graph.search import (
     arxiv_search,
     brave_search,
@@ -22,88 +30,106 @@ from app.workflows.src.research_graph.synthesis import synthesize_statement
 
 async def router_node(state: State) -> Dict[str, Any]:
     """Analyze statements and decide which sources to query using Grok."""
-    routing_decisions = []
+    statements = state.statements_to_research
+    all_sources = await route_statements(statements)
 
-    for statement in state.statements_to_research:
-        sources = await route_statement(statement)
-        routing_decisions.append({"statement": statement, "sources": sources})
+    routing_decisions = [
+        {"statement": statement, "sources": sources}
+        for statement, sources in zip(statements, all_sources)
+    ]
 
     return {"routing_decisions": routing_decisions}
 
 
+async def _search_brave(statement: str, api_key: str) -> Dict[str, Any]:
+    """Run a Brave search for one statement and attribute the result to it."""
+    try:
+        result = await brave_search(statement, api_key)
+        return {
+            "statement": statement,
+            "source": "brave",
+            "results": result.get("web", {}).get("results", []),
+        }
+    except Exception as e:
+        return {
+            "statement": statement,
+            "source": "brave",
+            "error": str(e),
+        }
+
+
+async def _search_arxiv(statement: str) -> Dict[str, Any]:
+    """Run an arXiv search for one statement and attribute the result to it."""
+    try:
+        result = await arxiv_search(statement)
+        return {
+            "statement": statement,
+            "source": "arxiv",
+            "query_used": result.get("query_used", ""),
+            "results": result.get("results", []),
+        }
+    except Exception as e:
+        return {
+            "statement": statement,
+            "source": "arxiv",
+            "error": str(e),
+        }
+
+
+async def _search_congress(statement: str) -> Dict[str, Any]:
+    """Run a Congress.gov search for one statement and attribute the result to it."""
+    try:
+        result = await congress_search(statement)
+        return {
+            "statement": statement,
+            "source": "congress",
+            "query_used": result.get("query_used", ""),
+            "results": result.get("results", []),
+        }
+    except Exception as e:
+        return {
+            "statement": statement,
+            "source": "congress",
+            "error": str(e),
+        }
+
+
 async def brave_search_node(state: State) -> Dict[str, Any]:
     """Search using Brave Search API."""
     brave_api_key = os.getenv("BRAVE_API_KEY")
     if not brave_api_key:
         return {"brave_results": []}
 
-    results = []
-    for decision in state.routing_decisions:
-        if "brave" in decision["sources"]:
-            statement = decision["statement"]
-            try:
-                result = await brave_search(statement, brave_api_key)
-                results.append({
-                    "statement": statement,
-                    "source": "brave",
-                    "results": result.get("web", {}).get("results", []),
-                })
-            except Exception as e:
-                results.append({
-                    "statement": statement,
-                    "source": "brave",
-                    "error": str(e),
-                })
-
-    return {"brave_results": results}
+    # Queries run concurrently; brave_search enforces the source's limits
+    results = await asyncio.gather(*(
+        _search_brave(decision["statement"], brave_api_key)
+        for decision in state.routing_decisions
+        if "brave" in decision["sources"]
+    ))
+
+    return {"brave_results": list(results)}
 
 
 async def arxiv_search_node(state: State) -> Dict[str, Any]:
     """Search arXiv for scientific papers."""
-    results = []
-    for decision in state.routing_decisions:
-        if "arxiv" in decision["sources"]:
-            statement = decision["statement"]
-            try:
-                result = await arxiv_search(statement)
-                results.append({
-                    "statement": statement,
-                    "source": "arxiv",
-                    "query_used": result.get("query_used", ""),
-                    "results": result.get("results", []),
-                })
-            except Exception as e:
-                results.append({
-                    "statement": statement,
-                    "source": "arxiv",
-                    "error": str(e),
-                })
-
-    return {"arxiv_results": results}
+    results = await asyncio.gather(*(
+        _search_arxiv(decision["statement"])
+        for decision in state.routing_decisions
+        if "arxiv" in decision["sources"]
+    ))
+
+    return {"arxiv_results": list(results)}
 
 
 async def congress_search_node(state: State) -> Dict[str, Any]:
     """Search Congress.gov for legislation."""
-    results = []
-    for decision in state.routing_decisions:
-        if "congress" in decision["sources"]:
-            statement = decision["statement"]
-            try:
-                result = await congress_search(statement)
-                results.append({
-                    "statement": statement,
-                    "source": "congress",
-                    "query_used": result.get("query_used", ""),
-                    "results": result.get("results", []),
-                })
-            except Exception as e:
-                results.append({
-                    "statement": statement,
-                    "source": "congress",
-                    "error": str(e),
-                })
-
-    return {"congress_results": results}
+    results = await asyncio.gather(*(
+        _search_congress(decision["statement"])
+        for decision in state.routing_decisions
+        if "congress" in decision["sources"]
+    ))
+
+    return {"congress_results": list(results)}
 
 
 async def aggregate_results_node(state: State) -> Dict[str, Any]:
@@ -122,9 +148,11 @@ async def aggregate_results_node(state: State) -> Dict[str, Any]:
 
 
 async def synthesis_node(state: State) -> Dict[str, Any]:
-    """Synthesize search results to verify/refute each statement with confidence scoring."""
-    synthesized_results = []
+    """Synthesize search results to verify/refute each statement with confidence scoring.
 
+    Statements are synthesized concurrently (bounded by SYNTHESIS_MAX_CONCURRENCY)
+    and returned in input order, along with how long each one took.
+    """
     # Group search results by statement
     statements_with_results = {}
     for statement in state.statements_to_research:
@@ -137,12 +165,27 @@ async def synthesis_node(state: State) -> Dict[str, Any]:
             if statement in statements_with_results:
                 statements_with_results[statement].append(result)
 
-    # Synthesize each statement
-    for statement, results in statements_with_results.items():
+    async def timed_synthesis(statement: str, results: list[dict]) -> tuple[dict, dict]:
+        started = time.perf_counter()
         verification = await synthesize_statement(statement, results)
-        synthesized_results.append(verification)
+        timing = {
+            "statement": statement,
+            "seconds": round(time.perf_counter() - started, 3),
+        }
+        return verification, timing
 
-    return {"synthesized_results": synthesized_results}
+    # Synthesize each statement
+    outcomes = await asyncio.gather(
+        *(
+            timed_synthesis(statement, results)
+            for statement, results in statements_with_results.items()
+        )
+    )
+
+    return {
+        "synthesized_results": [verification for verification, _ in outcomes],
+        "synthesis_timings": [timing for _, timing in outcomes],
+    }
 
 
 graph = (
@@ -164,3 +207,99 @@ graph = (
     .add_edge("synthesis", "__end__")
     .compile(name="Research Pipeline")
 )
+
+
+# Map-reduce variant: one route -> search -> synthesize pipeline per statement,
+# so each verdict only waits on its own sources.
+
+
+def _emit_progress(state: StatementState, event: str, **data: Any) -> None:
+    """Emit a timestamped progress event on the graph's custom stream."""
+    writer = get_stream_writer()
+    writer({
+        "event": event,
+        "index": state.index,
+        "statement": state.statement,
+        "timestamp": time.time(),
+        **data,
+    })
+
+
+async def route_statement_node(state: StatementState) -> Dict[str, Any]:
+    """Decide which sources to query for a single statement."""
+    sources = await route_statement(state.statement)
+    _emit_progress(state, "routed", sources=sources)
+    return {"sources": sources}
+
+
+async def search_statement_node(state: StatementState) -> Dict[str, Any]:
+    """Query every routed source for a single statement concurrently."""
+    searches = []
+    brave_api_key = os.getenv("BRAVE_API_KEY")
+    if "brave" in state.sources and brave_api_key:
+        searches.append(_search_brave(state.statement, brave_api_key))
+    if "arxiv" in state.sources:
+        searches.append(_search_arxiv(state.statement))
+    if "congress" in state.sources:
+        searches.append(_search_congress(state.statement))
+
+    async def search_and_report(search) -> Dict[str, Any]:
+        result = await search
+        _emit_progress(
+            state,
+            "sources_returned",
+            source=result["source"],
+            result_count=len(result.get("results", [])),
+            error=result.get("error"),
+        )
+        return result
+
+    results = await asyncio.gather(*(search_and_report(search) for search in searches))
+    return {"search_results": list(results)}
+
+
+async def synthesize_statement_node(state: StatementState) -> Dict[str, Any]:
+    """Synthesize the search results of a single statement."""
+    verification = await synthesize_statement(state.statement, state.search_results)
+    _emit_progress(state, "verdict", verification=verification)
+    return {"statement_results": [{"index": state.index, "verification": verification}]}
+
+
+statement_graph = (
+    StateGraph(StatementState)
+    .add_node("route", route_statement_node)
+    .add_node("search", search_statement_node)
+    .add_node("synthesize", synthesize_statement_node)
+    .add_edge("__start__", "route")
+    .add_edge("route", "search")
+    .add_edge("search", "synthesize")
+    .add_edge("synthesize", "__end__")
+    .compile(name="Statement Research Pipeline")
+)
+
+
+def fan_out_statements(state: MapReduceState) -> list[Send] | str:
+    """Send every statement to its own research pipeline."""
+    if not state.statements_to_research:
+        return "reduce"
+    return [
+        Send("research_statement", {"statement": statement, "index": index})
+        for index, statement in enumerate(state.statements_to_research)
+    ]
+
+
+async def reduce_node(state: MapReduceState) -> Dict[str, Any]:
+    """Collect per-statement verdicts in input order."""
+    ordered = sorted(state.statement_results, key=lambda result: result["index"])
+    return {"synthesized_results": [result["verification"] for result in ordered]}
+
+
+map_reduce_graph = (
+    StateGraph(MapReduceState)
+    .add_node("research_statement", statement_graph)
+    .add_node("reduce", reduce_node)
+    .add_conditional_edges("__start__", fan_out_statements, ["research_statement", "reduce"])
+    .add_edge("research_statement", "reduce")
+    .add_edge("reduce", "__end__")
+    .compile(name="Research Map-Reduce Pipeline")
+)
@@ -0,0 +1,54 @@
+"""Shared pooled HTTP clients for the research search sources.
+
+One long-lived ``httpx.AsyncClient`` per source keeps connections (DNS, TCP
+and TLS) alive across research runs and caps connections to that source's
+host. The FastAPI lifespan opens and closes them; outside the app (e.g. the
+LangGraph dev server) they are created lazily on first use.
+"""
+
+import os
+
+import httpx
+
+SOURCES = ("brave", "arxiv", "congress")
+
+MAX_CONNECTIONS_PER_HOST = int(os.getenv("RESEARCH_MAX_CONNECTIONS_PER_HOST", "10"))
+KEEPALIVE_EXPIRY_SECONDS = float(os.getenv("RESEARCH_KEEPALIVE_EXPIRY_SECONDS", "60"))
+REQUEST_TIMEOUT_SECONDS = float(os.getenv("RESEARCH_REQUEST_TIMEOUT_SECONDS", "20"))
+
+_clients: dict[str, httpx.AsyncClient] = {}
+
+
+def _create_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        http2=True,
+        follow_redirects=True,
+        timeout=REQUEST_TIMEOUT_SECONDS,
+        limits=httpx.Limits(
+            max_connections=MAX_CONNECTIONS_PER_HOST,
+            max_keepalive_connections=MAX_CONNECTIONS_PER_HOST,
+            keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS,
+        ),
+    )
+
+
+def get_client(source: str) -> httpx.AsyncClient:
+    """Return the pooled client for a search source, creating it if needed."""
+    client = _clients.get(source)
+    if client is None or client.is_closed:
+        client = _clients[source] = _create_client()
+    return client
+
+
+def open_clients() -> None:
+    """Create the pooled clients for every search source."""
+    for source in SOURCES:
+        get_client(source)
+
+
+async def close_clients() -> None:
+    """Close every pooled client."""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        await client.aclose()
@@ -0,0 +1,188 @@
+"""Per-source concurrency and rate limits for external search APIs."""
+
+import asyncio
+import os
+import time
+from contextlib import asynccontextmanager
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Mapping, Optional
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delay in seconds or HTTP date) into seconds."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_header_list(value: Optional[str]) -> list[float]:
+    """Parse a comma-separated X-RateLimit-* header (one value per window)."""
+    if not value:
+        return []
+    try:
+        return [float(part) for part in value.split(",") if part.strip()]
+    except ValueError:
+        return []
+
+
+class RateLimitExceeded(RuntimeError):
+    """Raised when a source cannot be called within its maximum wait."""
+
+
+class SourceLimiter:
+    """Concurrency cap plus a token-bucket rate limit for one search source.
+
+    The bucket refills at ``rate_per_second`` up to ``burst`` tokens and every
+    request takes one. Waiters are served in arrival order. Response headers
+    fed to ``observe`` can drain the bucket or pause it: ``Retry-After`` and
+    exhausted ``X-RateLimit-Remaining`` windows block until their reset.
+    A caller that would wait longer than ``max_wait_seconds`` (e.g. behind a
+    monthly quota reset) gets ``RateLimitExceeded`` instead of queueing.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrency: int,
+        rate_per_second: float,
+        burst: int = 1,
+        max_wait_seconds: float = 30.0,
+    ):
+        """Start with a full bucket and no waiters."""
+        self.name = name
+        self.max_wait_seconds = max_wait_seconds
+        self.rate_per_second = rate_per_second
+        self.capacity = float(max(1, burst))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._lock = asyncio.Lock()
+        self._waiting = 0
+        self.acquired = 0
+        self.throttled = 0
+        self.rejected = 0
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate_per_second)
+        self._updated = now
+
+    def _block(self, until: float) -> None:
+        self._blocked_until = max(self._blocked_until, until)
+        self._tokens = 0.0
+
+    async def acquire(self) -> None:
+        """Wait for a token, honouring any server-imposed pause.
+
+        Raises:
+            RateLimitExceeded: If no token is available within ``max_wait_seconds``
+        """
+        self._waiting += 1
+        waited = False
+        deadline = time.monotonic() + self.max_wait_seconds
+        try:
+            async with self._lock:
+                while True:
+                    now = time.monotonic()
+                    self._refill(now)
+                    delay = self._blocked_until - now
+                    if delay <= 0:
+                        if self._tokens >= 1:
+                            self._tokens -= 1
+                            break
+                        delay = (1 - self._tokens) / self.rate_per_second
+                    if now + delay > deadline:
+                        self.rejected += 1
+                        raise RateLimitExceeded(
+                            f"{self.name} rate limit: next request allowed in {delay:.0f}s"
+                        )
+                    waited = True
+                    await asyncio.sleep(delay)
+        finally:
+            self._waiting -= 1
+        self.acquired += 1
+        if waited:
+            self.throttled += 1
+
+    def observe(self, headers: Mapping[str, str]) -> None:
+        """Adjust the bucket from Retry-After and X-RateLimit-* response headers."""
+        now = time.monotonic()
+
+        retry_after = _parse_retry_after(headers.get("retry-after"))
+        if retry_after:
+            self._block(now + retry_after)
+
+        remaining = _parse_header_list(headers.get("x-ratelimit-remaining"))
+        resets = _parse_header_list(headers.get("x-ratelimit-reset"))
+        for window, left in enumerate(remaining):
+            if left <= 0 and window < len(resets):
+                reset = resets[window]
+                # Large values are epoch timestamps, small ones are delays
+                if reset > 1e9:
+                    reset -= time.time()
+                self._block(now + max(0.0, reset))
+
+        if remaining:
+            self._refill(now)
+            self._tokens = min(self._tokens, max(0.0, min(remaining)))
+
+    @asynccontextmanager
+    async def limit(self) -> AsyncIterator[None]:
+        """Hold a concurrency slot and a rate-limit token for one request."""
+        async with self._semaphore:
+            await self.acquire()
+            yield
+
+    def stats(self) -> dict[str, Any]:
+        """Return current token level and counters."""
+        now = time.monotonic()
+        self._refill(now)
+        return {
+            "tokens": round(self._tokens, 3),
+            "capacity": self.capacity,
+            "rate_per_second": self.rate_per_second,
+            "waiting": self._waiting,
+            "blocked_for_seconds": round(max(0.0, self._blocked_until - now), 3),
+            "acquired": self.acquired,
+            "throttled": self.throttled,
+            "rejected": self.rejected,
+        }
+
+
+brave_limiter = SourceLimiter(
+    "brave",
+    max_concurrency=int(os.getenv("BRAVE_MAX_CONCURRENCY", "3")),
+    rate_per_second=float(os.getenv("BRAVE_RATE_PER_SECOND", "1")),
+    burst=int(os.getenv("BRAVE_RATE_BURST", "1")),
+    max_wait_seconds=float(os.getenv("BRAVE_MAX_WAIT_SECONDS", "30")),
+)
+
+arxiv_limiter = SourceLimiter(
+    "arxiv",
+    max_concurrency=int(os.getenv("ARXIV_MAX_CONCURRENCY", "1")),
+    # arXiv asks for no more than one request every 3 seconds
+    rate_per_second=float(os.getenv("ARXIV_RATE_PER_SECOND", str(1 / 3))),
+    burst=int(os.getenv("ARXIV_RATE_BURST", "1")),
+    max_wait_seconds=float(os.getenv("ARXIV_MAX_WAIT_SECONDS", "60")),
+)
+
+congress_limiter = SourceLimiter(
+    "congress",
+    max_concurrency=int(os.getenv("CONGRESS_MAX_CONCURRENCY", "5")),
+    rate_per_second=float(os.getenv("CONGRESS_RATE_PER_SECOND", "1")),
+    burst=int(os.getenv("CONGRESS_RATE_BURST", "5")),
+    max_wait_seconds=float(os.getenv("CONGRESS_MAX_WAIT_SECONDS", "30")),
+)
+
+limiters = {
+    limiter.name: limiter
+    for limiter in (brave_limiter, arxiv_limiter, congress_limiter)
+}
@@ -1,8 +1,9 @@
 """Pydantic models for the research graph."""
 
+import operator
 from dataclasses import dataclass, field
 from pydantic import BaseModel, Field
-from typing import Literal
+from typing import Annotated, Literal
 
 
 class RoutingDecision(BaseModel):
@@ -17,6 +18,17 @@ class RoutingDecision(BaseModel):
     )
 
 
+class BatchRoutingDecision(BaseModel):
+    """Structured output for routing several statements in one call."""
+
+    decisions: list[RoutingDecision] = Field(
+        description=(
+            "One routing decision per statement, in the same order as the "
+            "numbered statements in the prompt."
+        )
+    )
+
+
 class ArxivQuery(BaseModel):
     """Optimized arXiv search query."""
 
@@ -86,4 +98,24 @@ class State:
     congress_results: list[dict] = field(default_factory=list)
     search_results: list[dict] | None = None
     synthesized_results: list[dict] = field(default_factory=list)
+    synthesis_timings: list[dict] = field(default_factory=list)
+
+
+@dataclass
+class MapReduceState:
+    """State for the per-statement map-reduce research pipeline."""
+
+    statements_to_research: list[str]
+    statement_results: Annotated[list[dict], operator.add] = field(default_factory=list)
+    synthesized_results: list[dict] = field(default_factory=list)
+
 
+@dataclass
+class StatementState:
+    """State for researching a single statement (route, search, synthesize)."""
+
+    statement: str
+    index: int = 0
+    sources: list[str] = field(default_factory=list)
+    search_results: list[dict] = field(default_factory=list)
+    statement_results: Annotated[list[dict], operator.add] = field(default_factory=list)
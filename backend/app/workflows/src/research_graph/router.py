@@ -1,15 +1,35 @@
 """Routing logic for determining which search sources to query."""
 
+import asyncio
 import os
 from typing import List
 
 from dotenv import load_dotenv
 from langchain_xai import ChatXAI
 
-from app.workflows.src.research_graph.models import RoutingDecision
+from app.workflows.src.llm_cache import model_cache
+from app.workflows.src.research_graph.models import (
+    BatchRoutingDecision,
+    RoutingDecision,
+)
 
 load_dotenv()
 
+VALID_SOURCES = ["brave", "arxiv", "congress"]
+
+# Maximum number of concurrent per-statement routing calls
+ROUTER_MAX_CONCURRENCY = int(os.getenv("ROUTER_MAX_CONCURRENCY", "5"))
+# Route every statement with a single structured-output call
+ROUTER_BATCH_MODE = os.getenv("ROUTER_BATCH_MODE", "false").lower() == "true"
+
+_routing_semaphore = asyncio.Semaphore(ROUTER_MAX_CONCURRENCY)
+
+
+def _clean_sources(sources: List[str]) -> List[str]:
+    """Drop unknown sources and fall back to brave when nothing is left."""
+    sources = [s for s in sources if s in VALID_SOURCES]
+    return sources or ["brave"]
+
 
 async def route_statement(statement: str) -> List[str]:
     """Use grok to determine which sources to query.
@@ -34,25 +54,73 @@ Rules:
 - Include 'congress' only if the statement references US legislation, bills, policy, or congressional matters"""
 
     try:
-        result: RoutingDecision = await routing_llm.ainvoke(prompt)
-        sources = result.sources
-
-        valid_sources = ["brave", "arxiv", "congress"]
-        sources = [s for s in sources if s in valid_sources]
-
-        if not sources:
-            sources = ["brave"]
-
-        return sources
+        async with _routing_semaphore:
+            result: RoutingDecision = await routing_llm.ainvoke(prompt)
+        return _clean_sources(result.sources)
 
     except Exception as e:
         print(f"[ROUTER ERROR] Routing error: {e}, falling back to brave search")
         return ["brave"]
 
 
+async def route_statements_batch(statements: List[str]) -> List[List[str]]:
+    """Use grok to route every statement with one structured-output call.
+
+    Returns one list of source names per statement, in input order.
+    """
+    numbered = "\n".join(f'{i}. "{statement}"' for i, statement in enumerate(statements, 1))
+    prompt = f"""You are a routing agent that determines which search sources are relevant for each statement.
+
+Available sources:
+- brave: General web search for news, companies, people, general facts
+- arxiv: Scientific papers, research studies, academic publications
+- congress: US legislation, bills, congressional hearings, policy
+
+Analyze each of these statements and decide which sources to query for it:
+
+{numbered}
+
+Rules:
+- Return exactly {len(statements)} decisions, one per statement, in the same order
+- Select ALL relevant sources (can be multiple)
+- Always include 'brave' unless the statement is purely academic or legislative
+- Include 'arxiv' only if the statement references research, studies, papers, or scientific concepts
+- Include 'congress' only if the statement references US legislation, bills, policy, or congressional matters"""
+
+    result: BatchRoutingDecision = await batch_routing_llm.ainvoke(prompt)
+    if len(result.decisions) != len(statements):
+        raise ValueError(
+            f"Expected {len(statements)} routing decisions, got {len(result.decisions)}"
+        )
+    return [_clean_sources(decision.sources) for decision in result.decisions]
+
+
+async def route_statements(statements: List[str]) -> List[List[str]]:
+    """Route all statements, keeping the output in input order.
+
+    Uses one batched call when ROUTER_BATCH_MODE is enabled, falling back to
+    concurrent per-statement routing (bounded by ROUTER_MAX_CONCURRENCY).
+    """
+    if ROUTER_BATCH_MODE and statements:
+        try:
+            return await route_statements_batch(statements)
+        except Exception as e:
+            print(f"[ROUTER ERROR] Batch routing error: {e}, routing per statement")
+
+    return list(await asyncio.gather(*(route_statement(s) for s in statements)))
+
+
 routing_llm = ChatXAI(
     model="grok-4-fast-non-reasoning",
     api_key=os.getenv("XAI_API_KEY"),
     temperature=0,
+    cache=model_cache(),
 ).with_structured_output(RoutingDecision)
 
+batch_routing_llm = ChatXAI(
+    model="grok-4-fast-non-reasoning",
+    api_key=os.getenv("XAI_API_KEY"),
+    temperature=0,
+    cache=model_cache(),
+).with_structured_output(BatchRoutingDecision)
+
@@ -1,21 +1,28 @@
 """Search API functions for different sources."""
 
-import asyncio
 import os
+from datetime import datetime
+from typing import Optional
+from xml.etree import ElementTree
 
-import aiohttp
-import arxiv
 from dotenv import load_dotenv
 from langchain_xai import ChatXAI
 
+from app.workflows.src.llm_cache import model_cache
+from app.workflows.src.research_graph.http import get_client
+from app.workflows.src.research_graph.limits import (
+    arxiv_limiter,
+    brave_limiter,
+    congress_limiter,
+)
 from app.workflows.src.research_graph.models import ArxivQuery, CongressQuery
+from app.workflows.src.research_graph.search_cache import search_cache
 
 load_dotenv()
 
 
 async def brave_search(query: str, api_key: str) -> dict:
     """Perform a Brave Search API query."""
-    await asyncio.sleep(1)
     url = "https://api.search.brave.com/res/v1/web/search"
     headers = {
         "Accept": "application/json",
@@ -24,16 +31,28 @@ async def brave_search(query: str, api_key: str) -> dict:
     }
     params = {"q": query, "safesearch": "off", "count": 5}
 
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url, headers=headers, params=params) as response:
-            response.raise_for_status()
-            return await response.json()
+    cached = await search_cache.get("brave", query)
+    if cached is not None:
+        return cached
+
+    # Pooled keep-alive client shared by every Brave query
+    async with brave_limiter.limit():
+        response = await get_client("brave").get(url, headers=headers, params=params)
+    brave_limiter.observe(response.headers)
+    response.raise_for_status()
+    result = response.json()
+
+    await search_cache.set(
+        "brave", query, result, negative=not result.get("web", {}).get("results")
+    )
+    return result
 
 
 arxiv_llm = ChatXAI(
     model="grok-4-fast-non-reasoning",
     api_key=os.getenv("XAI_API_KEY"),
     temperature=0,
+    cache=model_cache(),
 ).with_structured_output(ArxivQuery)
 
 
@@ -41,6 +60,7 @@ congress_llm = ChatXAI(
     model="grok-4-fast-non-reasoning",
     api_key=os.getenv("XAI_API_KEY"),
     temperature=0,
+    cache=model_cache(),
 ).with_structured_output(CongressQuery)
 
 
@@ -128,41 +148,78 @@ Now generate a query following these rules."""
     return result.query
 
 
-def _fetch_arxiv_papers(optimized_query: str) -> list:
-    """Synchronous function to fetch arXiv papers (run in thread)."""
-    search = arxiv.Search(
-        query=optimized_query,
-        max_results=5,
-        sort_by=arxiv.SortCriterion.Relevance,
-    )
-    
+ARXIV_API_URL = "https://export.arxiv.org/api/query"
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+
+
+def _collapse(text: Optional[str]) -> str:
+    """Collapse the line wrapping arXiv puts in Atom titles and abstracts."""
+    return " ".join((text or "").split())
+
+
+def _parse_arxiv_feed(content: bytes) -> list:
+    """Pull the fields we keep out of an arXiv Atom response."""
     results = []
-    for paper in search.results():
+    for entry in ElementTree.fromstring(content).iter(f"{ATOM_NS}entry"):
+        published = entry.findtext(f"{ATOM_NS}published", "")
+        pdf_url = None
+        for link in entry.iter(f"{ATOM_NS}link"):
+            if link.get("title") == "pdf":
+                pdf_url = link.get("href")
+                break
         results.append({
-            "title": paper.title,
-            "authors": [author.name for author in paper.authors],
-            "summary": paper.summary[:500],  # Truncate long abstracts
-            "published": paper.published.isoformat(),
-            "url": paper.entry_id,
-            "pdf_url": paper.pdf_url,
+            "title": _collapse(entry.findtext(f"{ATOM_NS}title")),
+            "authors": [
+                _collapse(author.findtext(f"{ATOM_NS}name"))
+                for author in entry.iter(f"{ATOM_NS}author")
+            ],
+            "summary": _collapse(entry.findtext(f"{ATOM_NS}summary"))[:500],  # Truncate long abstracts
+            "published": datetime.fromisoformat(published.replace("Z", "+00:00")).isoformat() if published else None,
+            "url": entry.findtext(f"{ATOM_NS}id"),
+            "pdf_url": pdf_url,
         })
     return results
 
 
+async def _fetch_arxiv_papers(optimized_query: str) -> list:
+    """Query the arXiv Atom API on the shared pooled client.
+
+    Pacing comes from ``arxiv_limiter``, which queues every caller in the
+    process behind one politeness schedule.
+    """
+    params = {
+        "search_query": optimized_query,
+        "start": 0,
+        "max_results": 5,
+        "sortBy": "relevance",
+        "sortOrder": "descending",
+    }
+    async with arxiv_limiter.limit():
+        response = await get_client("arxiv").get(ARXIV_API_URL, params=params)
+    arxiv_limiter.observe(response.headers)
+    response.raise_for_status()
+    return _parse_arxiv_feed(response.content)
+
+
 async def arxiv_search(query: str) -> dict:
     """Search arXiv for scientific papers."""
+    cached = await search_cache.get("arxiv", query)
+    if cached is not None:
+        return cached
+
     try:
         # Optimize query using LLM
         optimized_query = await optimize_arxiv_query(query)
 
-        # Run blocking arxiv library call in thread pool
-        results = await asyncio.to_thread(_fetch_arxiv_papers, optimized_query)
+        results = await _fetch_arxiv_papers(optimized_query)
 
-        return {
+        result = {
             "results": results,
             "total_results": len(results),
             "query_used": optimized_query,
         }
+        await search_cache.set("arxiv", query, result, negative=not results)
+        return result
 
     except Exception as e:
         return {
@@ -182,6 +239,10 @@ async def congress_search(query: str) -> dict:
             "error": "CONGRESS_API_KEY not configured",
         }
     
+    cached = await search_cache.get("congress", query)
+    if cached is not None:
+        return cached
+
     try:
         # Optimize query using LLM with search operators
         optimized_query = await optimize_congress_query(query)
@@ -203,49 +264,52 @@ async def congress_search(query: str) -> dict:
         if optimized_query:
             params["query"] = optimized_query
         
-        # Make API request
-        async with aiohttp.ClientSession() as session:
-            async with session.get(base_url, headers=headers, params=params) as response:
-                response.raise_for_status()
-                data = await response.json()
-                
-                # Parse bill results
-                results = []
-                bills = data.get("bills", [])
-                
-                for bill in bills[:5]:
-                    # Extract bill details
-                    title = bill.get("title", "")
-                    number = bill.get("number", "")
-                    bill_type = bill.get("type", "")
-                    congress = bill.get("congress", "")
-                    
-                    # Build full bill identifier
-                    bill_identifier = f"{bill_type} {number}" if bill_type and number else ""
-                    
-                    latest_action = bill.get("latestAction", {})
-                    latest_action_text = latest_action.get("text", "") if latest_action else ""
-                    latest_action_date = latest_action.get("actionDate", "") if latest_action else ""
-                    
-                    result_item = {
-                        "bill_number": bill_identifier,
-                        "title": title,
-                        "congress": congress,
-                        "type": bill_type,
-                        "introduced_date": bill.get("introducedDate", ""),
-                        "latest_action": latest_action_text,
-                        "latest_action_date": latest_action_date,
-                        "url": bill.get("url", ""),
-                        "origin_chamber": bill.get("originChamber", ""),
-                    }
-                    
-                    results.append(result_item)
-                
-                return {
-                    "results": results,
-                    "total_results": len(results),
-                    "query_used": optimized_query,
-                }
+        # Make API request over the pooled client
+        async with congress_limiter.limit():
+            response = await get_client("congress").get(base_url, headers=headers, params=params)
+        congress_limiter.observe(response.headers)
+        response.raise_for_status()
+        data = response.json()
+        
+        # Parse bill results
+        results = []
+        bills = data.get("bills", [])
+        
+        for bill in bills[:5]:
+            # Extract bill details
+            title = bill.get("title", "")
+            number = bill.get("number", "")
+            bill_type = bill.get("type", "")
+            congress = bill.get("congress", "")
+            
+            # Build full bill identifier
+            bill_identifier = f"{bill_type} {number}" if bill_type and number else ""
+            
+            latest_action = bill.get("latestAction", {})
+            latest_action_text = latest_action.get("text", "") if latest_action else ""
+            latest_action_date = latest_action.get("actionDate", "") if latest_action else ""
+            
+            result_item = {
+                "bill_number": bill_identifier,
+                "title": title,
+                "congress": congress,
+                "type": bill_type,
+                "introduced_date": bill.get("introducedDate", ""),
+                "latest_action": latest_action_text,
+                "latest_action_date": latest_action_date,
+                "url": bill.get("url", ""),
+                "origin_chamber": bill.get("originChamber", ""),
+            }
+            
+            results.append(result_item)
+        
+        result = {
+            "results": results,
+            "total_results": len(results),
+            "query_used": optimized_query,
+        }
+        await search_cache.set("congress", query, result, negative=not results)
+        return result
     
     except Exception as e:
         return {
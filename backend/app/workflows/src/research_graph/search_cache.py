@@ -0,0 +1,195 @@
+"""Persistent TTL cache for search results, keyed by source and normalized query.
+
+The cache is a stack of backends checked in order (by default an in-memory
+LRU in front of SQLite on disk). A hit in a lower backend is copied into the
+ones above it. Every source has its own TTL, and empty results are cached
+for a shorter, separate TTL.
+"""
+
+import asyncio
+import json
+import os
+import sqlite3
+import time
+from collections import OrderedDict
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Optional, Protocol
+
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+
+SOURCE_TTL_SECONDS = {
+    "brave": float(os.getenv("SEARCH_CACHE_BRAVE_TTL_SECONDS", str(6 * 60 * 60))),
+    "arxiv": float(os.getenv("SEARCH_CACHE_ARXIV_TTL_SECONDS", str(7 * 24 * 60 * 60))),
+    "congress": float(os.getenv("SEARCH_CACHE_CONGRESS_TTL_SECONDS", str(24 * 60 * 60))),
+}
+NEGATIVE_TTL_SECONDS = float(os.getenv("SEARCH_CACHE_NEGATIVE_TTL_SECONDS", "600"))
+MEMORY_MAX_ENTRIES = int(os.getenv("SEARCH_CACHE_MEMORY_MAX_ENTRIES", "1024"))
+# Lives in CACHE_DIR next to the feed cache unless overridden
+SQLITE_PATH = os.getenv(
+    "SEARCH_CACHE_PATH", os.path.join(os.getenv("CACHE_DIR", "cache"), "search_cache.sqlite3")
+)
+# Comma-separated backends, checked in order: "memory", "sqlite"
+BACKENDS = os.getenv("SEARCH_CACHE_BACKENDS", "memory,sqlite")
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a query so trivially different spellings share an entry."""
+    return " ".join(query.lower().split())
+
+
+class CacheBackend(Protocol):
+    """Storage backend for cached search results."""
+
+    async def get(self, key: str) -> Optional[tuple[float, Any]]:
+        """Return (expires_at, value) for ``key``, or None."""
+        ...
+
+    async def set(self, key: str, value: Any, expires_at: float) -> None:
+        """Store ``value`` under ``key`` until ``expires_at`` (epoch seconds)."""
+        ...
+
+
+class MemoryBackend:
+    """Bounded in-memory LRU backend."""
+
+    def __init__(self, max_entries: int):
+        """Keep at most ``max_entries`` entries, evicting the least recently used."""
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    async def get(self, key: str) -> Optional[tuple[float, Any]]:
+        """Return (expires_at, value) for ``key`` and mark it recently used."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    async def set(self, key: str, value: Any, expires_at: float) -> None:
+        """Store ``value`` under ``key``, evicting the oldest entries over the cap."""
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+class SQLiteBackend:
+    """On-disk SQLite backend; queries run in a worker thread."""
+
+    def __init__(self, path: str):
+        """Use the database at ``path``; it is created on first use."""
+        self.path = Path(path)
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=5)
+        if not self._initialized:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS search_cache "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._initialized = True
+        return connection
+
+    def _get(self, key: str) -> Optional[tuple[float, Any]]:
+        with closing(self._connect()) as connection, connection:
+            row = connection.execute(
+                "SELECT expires_at, value FROM search_cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return row[0], json.loads(row[1])
+
+    def _set(self, key: str, value: Any, expires_at: float) -> None:
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO search_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value), expires_at),
+            )
+            # Opportunistically drop expired rows
+            connection.execute(
+                "DELETE FROM search_cache WHERE expires_at < ?", (time.time(),)
+            )
+
+    async def get(self, key: str) -> Optional[tuple[float, Any]]:
+        """Return (expires_at, value) for ``key``, or None."""
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, value: Any, expires_at: float) -> None:
+        """Store ``value`` under ``key`` and drop expired rows."""
+        await asyncio.to_thread(self._set, key, value, expires_at)
+
+
+class SearchCache:
+    """Tiered TTL cache for search results with per-source hit-rate counters."""
+
+    def __init__(self, backends: list[CacheBackend]):
+        """Look entries up in ``backends`` in order, fastest first."""
+        self.backends = backends
+        self._hits: dict[str, int] = {}
+        self._misses: dict[str, int] = {}
+
+    @staticmethod
+    def _key(source: str, query: str) -> str:
+        return f"{source}:{normalize_query(query)}"
+
+    async def get(self, source: str, query: str) -> Optional[Any]:
+        """Return a cached result, or None on a miss or expiry."""
+        key = self._key(source, query)
+        now = time.time()
+        for depth, backend in enumerate(self.backends):
+            try:
+                entry = await backend.get(key)
+            except Exception as e:
+                print(f"[SEARCH CACHE ERROR] Read failed: {e}")
+                continue
+            if entry is None or entry[0] <= now:
+                continue
+            expires_at, value = entry
+            # Promote into the faster backends
+            for upper in self.backends[:depth]:
+                await upper.set(key, value, expires_at)
+            self._hits[source] = self._hits.get(source, 0) + 1
+            return value
+        self._misses[source] = self._misses.get(source, 0) + 1
+        return None
+
+    async def set(self, source: str, query: str, value: Any, negative: bool = False) -> None:
+        """Cache a result; negative (empty) results use the short negative TTL."""
+        ttl = NEGATIVE_TTL_SECONDS if negative else SOURCE_TTL_SECONDS.get(source, DEFAULT_TTL_SECONDS)
+        key = self._key(source, query)
+        expires_at = time.time() + ttl
+        for backend in self.backends:
+            try:
+                await backend.set(key, value, expires_at)
+            except Exception as e:
+                print(f"[SEARCH CACHE ERROR] Write failed: {e}")
+
+    def stats(self) -> dict[str, Any]:
+        """Return hits, misses and hit rate per source."""
+        stats = {}
+        for source in sorted(set(self._hits) | set(self._misses)):
+            hits = self._hits.get(source, 0)
+            misses = self._misses.get(source, 0)
+            stats[source] = {
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": round(hits / (hits + misses), 3) if hits + misses else 0.0,
+            }
+        return stats
+
+
+def _build_backends() -> list[CacheBackend]:
+    backends: list[CacheBackend] = []
+    for name in BACKENDS.split(","):
+        name = name.strip()
+        if name == "memory":
+            backends.append(MemoryBackend(MEMORY_MAX_ENTRIES))
+        elif name == "sqlite":
+            backends.append(SQLiteBackend(SQLITE_PATH))
+    return backends
+
+
+search_cache = SearchCache(_build_backends())
@@ -1,20 +1,27 @@
 """LLM-based synthesis and verification of research results."""
 
+import asyncio
 import os
 from typing import Any
 
 from dotenv import load_dotenv
 from langchain_xai import ChatXAI
 
+from app.workflows.src.llm_cache import model_cache
 from app.workflows.src.research_graph.models import StatementVerification
 
 load_dotenv()
 
+# Maximum number of concurrent synthesis calls
+SYNTHESIS_MAX_CONCURRENCY = int(os.getenv("SYNTHESIS_MAX_CONCURRENCY", "5"))
+
+_synthesis_semaphore = asyncio.Semaphore(SYNTHESIS_MAX_CONCURRENCY)
 
 synthesis_llm = ChatXAI(
     model="grok-4-fast-non-reasoning",
     api_key=os.getenv("XAI_API_KEY"),
     temperature=0.3,
+    cache=model_cache(),
 ).with_structured_output(StatementVerification)
 
 
@@ -145,7 +152,8 @@ SOURCES LIST:
 Be helpful and informative. If the query is asking for information rather than verification, provide that information from the sources."""
 
     try:
-        result: StatementVerification = await synthesis_llm.ainvoke(prompt)
+        async with _synthesis_semaphore:
+            result: StatementVerification = await synthesis_llm.ainvoke(prompt)
         return result.model_dump()
     except Exception as e:
         # Fallback response if synthesis fails
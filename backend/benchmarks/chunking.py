@@ -0,0 +1,120 @@
+"""Benchmark single-pass chunking against one ffmpeg process per chunk.
+
+Generates synthetic episodes with ffmpeg's lavfi sine source and splits each
+one twice: with the old per-chunk approach (one seeking ffmpeg process per
+2-minute chunk, ``os.cpu_count()`` at a time) and with
+``prepare_audio_chunks``, which runs a single segment pass. Reports wall time
+and the CPU time of the ffmpeg/ffprobe children for each. Needs ffmpeg and
+ffprobe on PATH.
+
+    python -m benchmarks.chunking [--minutes 30 120 240]
+"""
+import argparse
+import asyncio
+import os
+import resource
+import subprocess
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable
+
+from app.core.config import settings
+from app.services.transcription_service import transcription_service
+
+DEFAULT_MINUTES = (30, 120, 240)
+
+
+def make_episode(path: Path, minutes: int) -> None:
+    """Write a stereo 128k MP3 of ``minutes`` length, like a typical podcast download."""
+    subprocess.run(
+        ["ffmpeg", "-y", "-v", "error", "-f", "lavfi",
+         "-i", f"sine=frequency=440:duration={minutes * 60}",
+         "-ac", "2", "-b:a", "128k", str(path)],
+        check=True
+    )
+
+
+def split_per_chunk(audio_file_path: Path, chunks_dir: Path) -> int:
+    """Split with one seeking ffmpeg process per chunk, like the old preparation."""
+    chunk_duration_sec = transcription_service.CHUNK_DURATION_MS / 1000
+    result = subprocess.run(
+        ["ffprobe", "-v", "error", "-show_entries", "format=duration",
+         "-of", "default=noprint_wrappers=1:nokey=1", str(audio_file_path)],
+        check=True, capture_output=True, text=True
+    )
+    total_duration_ms = int(float(result.stdout) * 1000)
+    num_chunks = (
+        total_duration_ms + transcription_service.CHUNK_DURATION_MS - 1
+    ) // transcription_service.CHUNK_DURATION_MS
+
+    def split_chunk(chunk_index: int) -> None:
+        subprocess.run(
+            [
+                "ffmpeg", "-y", "-v", "error",
+                "-ss", str(chunk_index * chunk_duration_sec),
+                "-t", str(chunk_duration_sec),
+                "-i", str(audio_file_path),
+                "-ac", "1",
+                "-b:a", "64k",
+                "-map", "0:a",
+                str(chunks_dir / f"chunk_{chunk_index:03d}.mp3")
+            ],
+            check=True
+        )
+
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        list(executor.map(split_chunk, range(num_chunks)))
+    return num_chunks
+
+
+def split_single_pass(audio_file_path: Path, chunks_dir: Path) -> int:
+    """Split with ``prepare_audio_chunks`` and its single segment pass."""
+    metadata = asyncio.run(transcription_service.prepare_audio_chunks(audio_file_path.name))
+    if metadata is None or metadata.get("status") != "complete":
+        raise SystemExit(f"prepare_audio_chunks failed for {audio_file_path.name}")
+    return metadata["total_chunks"]
+
+
+def measure(split: Callable[[Path, Path], int], audio_file_path: Path, chunks_dir: Path) -> tuple[int, float, float]:
+    """Return (chunks, wall seconds, child CPU seconds) for one split."""
+    chunks_dir.mkdir(parents=True)
+    before = resource.getrusage(resource.RUSAGE_CHILDREN)
+    started = time.perf_counter()
+    chunks = split(audio_file_path, chunks_dir)
+    wall = time.perf_counter() - started
+    after = resource.getrusage(resource.RUSAGE_CHILDREN)
+    cpu = (after.ru_utime - before.ru_utime) + (after.ru_stime - before.ru_stime)
+    produced = len(list(chunks_dir.glob("chunk_*.mp3")))
+    if produced != chunks:
+        raise SystemExit(f"Expected {chunks} chunks in {chunks_dir}, found {produced}")
+    return chunks, wall, cpu
+
+
+def main(minutes: list[int]) -> None:
+    """Split synthetic episodes of each length both ways and print the costs."""
+    with tempfile.TemporaryDirectory() as media_dir:
+        settings.MEDIA_DIR = Path(media_dir)
+        print(f"{os.cpu_count()} CPUs")
+        print(f"{'minutes':>7} {'approach':>11} {'chunks':>6} {'wall (s)':>9} {'CPU (s)':>8}")
+        for length in minutes:
+            audio_file_path = settings.MEDIA_DIR / f"synthetic_{length}.mp3"
+            make_episode(audio_file_path, length)
+            for name, split, chunks_dir in (
+                ("per-chunk", split_per_chunk, settings.MEDIA_DIR / f"per_chunk_{length}"),
+                # prepare_audio_chunks writes next to the episode, under its stem
+                ("single-pass", split_single_pass, settings.MEDIA_DIR / audio_file_path.stem / "chunks"),
+            ):
+                chunks, wall, cpu = measure(split, audio_file_path, chunks_dir)
+                print(f"{length:>7} {name:>11} {chunks:>6} {wall:>9.2f} {cpu:>8.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--minutes", type=int, nargs="+", default=list(DEFAULT_MINUTES),
+        help="Synthetic episode lengths to split"
+    )
+    args = parser.parse_args()
+    main(args.minutes)
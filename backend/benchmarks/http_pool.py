@@ -0,0 +1,91 @@
+"""Benchmark per-query HTTP sessions against the pooled research clients.
+
+Sends search-sized requests to a local stub server, once with a fresh client
+per query (how brave_search and congress_search used to open an aiohttp
+session per call) and once through the shared ``get_client`` pool, and
+reports per-query latency. The stub is plain HTTP on localhost, so the gap
+excludes DNS and TLS setup and understates the saving against real APIs.
+
+    python -m benchmarks.http_pool [--queries 200] [--concurrency 5]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Awaitable, Callable
+
+import httpx
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from app.workflows.src.research_graph.http import close_clients, get_client
+from benchmarks.stub_server import serve
+
+SEARCH_RESULT = {
+    "web": {
+        "results": [
+            {"title": f"Result {i}", "url": f"https://example.com/{i}", "description": "x" * 200}
+            for i in range(5)
+        ]
+    }
+}
+
+
+def stub_search_app() -> Starlette:
+    """Search endpoint that answers immediately with a fixed result page."""
+    async def search(request: Request) -> JSONResponse:
+        return JSONResponse(SEARCH_RESULT)
+
+    return Starlette(routes=[Route("/search", search)])
+
+
+async def run(
+    query: Callable[[int], Awaitable[None]], queries: int, concurrency: int
+) -> list[float]:
+    """Run ``queries`` calls, ``concurrency`` at a time; return per-call latencies."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def timed(i: int) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            await query(i)
+            latencies.append(time.perf_counter() - started)
+
+    await asyncio.gather(*(timed(i) for i in range(queries)))
+    return latencies
+
+
+async def main(queries: int, concurrency: int) -> None:
+    """Time both client modes against the stub and print latency percentiles."""
+    async with serve(stub_search_app()) as url:
+        async def per_call_session(i: int) -> None:
+            async with httpx.AsyncClient() as client:
+                response = await client.get(f"{url}/search", params={"q": f"query {i}"})
+                response.json()
+
+        async def pooled_client(i: int) -> None:
+            response = await get_client("brave").get(f"{url}/search", params={"q": f"query {i}"})
+            response.json()
+
+        print(f"{queries} queries, {concurrency} in flight")
+        print(f"{'client':>9} {'mean (ms)':>10} {'p50 (ms)':>9} {'p95 (ms)':>9}")
+        for name, query in (("per-call", per_call_session), ("pooled", pooled_client)):
+            await query(-1)  # warm up
+            latencies = sorted(await run(query, queries, concurrency))
+            p95 = latencies[int(len(latencies) * 0.95) - 1]
+            print(
+                f"{name:>9} {statistics.mean(latencies) * 1000:>10.2f} "
+                f"{statistics.median(latencies) * 1000:>9.2f} {p95 * 1000:>9.2f}"
+            )
+        await close_clients()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--queries", type=int, default=200, help="Queries per client mode")
+    parser.add_argument("--concurrency", type=int, default=5, help="Queries in flight at once")
+    args = parser.parse_args()
+    asyncio.run(main(args.queries, args.concurrency))
@@ -0,0 +1,85 @@
+"""Benchmark the critical path of research routing.
+
+Replaces the routing LLMs with fakes of fixed latency and times routing a
+list of statements sequentially (the old router_node loop), concurrently
+(``route_statements``) and with a single batched call (ROUTER_BATCH_MODE).
+
+    python -m benchmarks.routing [--latency 0.8] [--statements 5]
+"""
+import argparse
+import asyncio
+import time
+
+from app.workflows.src.research_graph import router
+from app.workflows.src.research_graph.models import (
+    BatchRoutingDecision,
+    RoutingDecision,
+)
+
+
+class FakeRoutingLLM:
+    """Routing model stand-in that answers after a fixed delay."""
+
+    def __init__(self, latency: float):
+        """Answer every call after ``latency`` seconds."""
+        self.latency = latency
+        self.calls = 0
+
+    async def ainvoke(self, prompt: str) -> RoutingDecision:
+        """Route the statement to Brave after the fixed delay."""
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        return RoutingDecision(sources=["brave"])
+
+
+class FakeBatchRoutingLLM(FakeRoutingLLM):
+    """Batched routing stand-in; one decision per numbered statement."""
+
+    async def ainvoke(self, prompt: str) -> BatchRoutingDecision:
+        """Route every statement in the prompt to Brave after the fixed delay."""
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        count = sum(1 for line in prompt.splitlines() if line[:1].isdigit() and '. "' in line)
+        return BatchRoutingDecision(decisions=[RoutingDecision(sources=["brave"])] * count)
+
+
+async def route_sequentially(statements: list[str]) -> list[list[str]]:
+    """Route one statement at a time, like the old router_node loop."""
+    return [await router.route_statement(statement) for statement in statements]
+
+
+async def main(latency: float, count: int) -> None:
+    """Time each routing mode and print LLM calls and critical path."""
+    statements = [f"Statement {i} about a study" for i in range(count)]
+    router.routing_llm = FakeRoutingLLM(latency)
+    router.batch_routing_llm = FakeBatchRoutingLLM(latency)
+
+    async def batched(statements: list[str]) -> list[list[str]]:
+        router.ROUTER_BATCH_MODE = True
+        try:
+            return await router.route_statements(statements)
+        finally:
+            router.ROUTER_BATCH_MODE = False
+
+    print(f"{count} statements, fake LLM latency {latency:.2f}s per call")
+    print(f"{'mode':>10} {'LLM calls':>9} {'critical path (s)':>18}")
+    for mode, route in (
+        ("sequential", route_sequentially),
+        ("concurrent", router.route_statements),
+        ("batched", batched),
+    ):
+        router.routing_llm.calls = router.batch_routing_llm.calls = 0
+        started = time.perf_counter()
+        decisions = await route(statements)
+        elapsed = time.perf_counter() - started
+        assert len(decisions) == count
+        calls = router.routing_llm.calls + router.batch_routing_llm.calls
+        print(f"{mode:>10} {calls:>9} {elapsed:>18.3f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency", type=float, default=0.8, help="Fake LLM latency per call (s)")
+    parser.add_argument("--statements", type=int, default=5, help="Statements to route")
+    args = parser.parse_args()
+    asyncio.run(main(args.latency, args.statements))
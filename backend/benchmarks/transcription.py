@@ -0,0 +1,117 @@
+"""Benchmark ordered, bounded-parallel chunk transcription.
+
+Runs ``transcribe_specific_chunks`` against a local fake Whisper server with
+a fixed per-request latency and reports time to first event and total wall
+time for ranges of 1, 10 and 60 chunks, sequentially and concurrently.
+Exits non-zero if the first event takes more than twice the fake latency,
+which means chunk 0 was queued behind later chunks.
+
+    python -m benchmarks.transcription [--latency 0.2] [--concurrency 4]
+"""
+import argparse
+import asyncio
+import json
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from openai import AsyncOpenAI
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from app.core.config import settings
+from app.services.transcription_service import transcription_service
+from benchmarks.stub_server import serve
+
+CHUNK_COUNTS = (1, 10, 60)
+FAKE_CHUNK_BYTES = 256 * 1024
+
+
+def fake_whisper_app(latency: float) -> Starlette:
+    """Whisper-compatible endpoint that answers after ``latency`` seconds."""
+
+    async def transcriptions(request: Request) -> JSONResponse:
+        await request.body()
+        await asyncio.sleep(latency)
+        return JSONResponse({
+            "text": "benchmark transcript",
+            "language": "english",
+            "duration": 120.0,
+            "segments": [{
+                "id": 0, "seek": 0, "start": 0.0, "end": 120.0,
+                "text": "benchmark transcript", "tokens": [], "temperature": 0.0,
+                "avg_logprob": 0.0, "compression_ratio": 1.0, "no_speech_prob": 0.0,
+            }],
+        })
+
+    return Starlette(routes=[Route("/v1/audio/transcriptions", transcriptions, methods=["POST"])])
+
+
+def make_episode(name: str, total_chunks: int) -> str:
+    """Lay out prepared chunks and metadata for a fake episode; return its filename."""
+    audio_dir = settings.MEDIA_DIR / name
+    chunks_dir = audio_dir / "chunks"
+    chunks_dir.mkdir(parents=True)
+    for i in range(total_chunks):
+        (chunks_dir / f"chunk_{i:03d}.mp3").write_bytes(b"\0" * FAKE_CHUNK_BYTES)
+    (audio_dir / "metadata.json").write_text(json.dumps({
+        "total_chunks": total_chunks,
+        "chunk_duration_seconds": transcription_service.CHUNK_DURATION_MS / 1000,
+        "total_duration_seconds": total_chunks * transcription_service.CHUNK_DURATION_MS / 1000,
+        "chunk_duration_ms": transcription_service.CHUNK_DURATION_MS,
+        "created_at": datetime.now().isoformat(),
+        "status": "complete",
+        "ready_chunks": total_chunks,
+    }))
+    return f"{name}.mp3"
+
+
+async def measure(filename: str, total_chunks: int, concurrency: int) -> tuple[float, float]:
+    """Return (time to first event, total wall time) for one range."""
+    started = time.perf_counter()
+    first_event = None
+    async for event in transcription_service.transcribe_specific_chunks(
+        filename, 0, total_chunks - 1, max_concurrency=concurrency
+    ):
+        if "error" in event:
+            raise RuntimeError(event["error"])
+        if first_event is None:
+            first_event = time.perf_counter() - started
+    return first_event, time.perf_counter() - started
+
+
+async def main(latency: float, concurrency: int) -> None:
+    """Time every range at both concurrency levels and check the first event."""
+    with tempfile.TemporaryDirectory() as media_dir:
+        settings.MEDIA_DIR = Path(media_dir)
+        async with serve(fake_whisper_app(latency)) as url:
+            transcription_service.client = AsyncOpenAI(api_key="benchmark", base_url=f"{url}/v1")
+            # Open the client's connection outside the measured runs
+            await measure(make_episode("warmup", 1), 1, 1)
+            slow_starts = []
+            print(f"Fake Whisper latency {latency:.2f}s per chunk")
+            print(f"{'chunks':>6} {'concurrency':>11} {'first event (s)':>16} {'total (s)':>10}")
+            for total_chunks in CHUNK_COUNTS:
+                for limit in sorted({1, concurrency}):
+                    filename = make_episode(f"bench_{total_chunks}_{limit}", total_chunks)
+                    first_event, total = await measure(filename, total_chunks, limit)
+                    print(f"{total_chunks:>6} {limit:>11} {first_event:>16.3f} {total:>10.3f}")
+                    if first_event > 2 * latency:
+                        slow_starts.append(f"{total_chunks} chunks at concurrency {limit}")
+            await transcription_service.client.close()
+    if slow_starts:
+        raise SystemExit(f"First event slower than {2 * latency:.2f}s for: {', '.join(slow_starts)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency", type=float, default=0.2, help="Fake Whisper latency per chunk (s)")
+    parser.add_argument(
+        "--concurrency", type=int, default=settings.TRANSCRIPTION_MAX_CONCURRENCY,
+        help="Concurrent transcriptions for the parallel runs"
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.latency, args.concurrency))
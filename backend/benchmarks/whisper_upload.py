@@ -0,0 +1,155 @@
+"""Benchmark the Whisper upload path for prepared chunks.
+
+Compares the old path, which decoded each chunk to PCM with pydub and
+re-encoded it into a temp file before uploading, with the direct upload of
+the chunk file. Both upload to a local fake Whisper server. For each path it
+reports CPU time per chunk (this process plus its ffmpeg children), the
+interpreter's peak RSS (where pydub holds the decoded PCM) and preparation
+latency: the time from picking up a chunk to handing a file to the client.
+Each path runs in a fresh interpreter so its peak RSS is its own.
+
+The pydub path needs ffmpeg and pydub, which is no longer a dependency:
+
+    pip install pydub
+    python -m benchmarks.whisper_upload [--chunks 10] [--latency 0.05]
+"""
+import argparse
+import asyncio
+import json
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from openai import AsyncOpenAI
+
+from app.services.transcription_service import transcription_service
+from benchmarks.stub_server import serve
+from benchmarks.transcription import fake_whisper_app
+
+MODES = ("pydub", "direct")
+CHUNK_SECONDS = 120
+
+
+def make_chunks(chunks_dir: Path, count: int) -> None:
+    """Write ``count`` 2-minute mono 64k MP3 chunks like the preparation produces."""
+    first = chunks_dir / "chunk_000.mp3"
+    subprocess.run(
+        ["ffmpeg", "-v", "error", "-f", "lavfi", "-i", f"sine=frequency=440:duration={CHUNK_SECONDS}",
+         "-ac", "1", "-b:a", "64k", str(first)],
+        check=True
+    )
+    for i in range(1, count):
+        shutil.copyfile(first, chunks_dir / f"chunk_{i:03d}.mp3")
+
+
+async def upload_pydub(chunk_path: Path) -> float:
+    """Decode, re-encode and upload like the old path; return preparation time."""
+    from pydub import AudioSegment
+
+    started = time.perf_counter()
+    audio_chunk = await asyncio.to_thread(AudioSegment.from_file, chunk_path)
+
+    def _export() -> str:
+        with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as temp_file:
+            audio_chunk.export(temp_file.name, format="mp3")
+            return temp_file.name
+
+    temp_path = await asyncio.to_thread(_export)
+    prepared = time.perf_counter() - started
+    try:
+        with open(temp_path, "rb") as audio_file:
+            await transcription_service.client.audio.transcriptions.create(
+                file=audio_file,
+                model="whisper-1",
+                response_format="verbose_json",
+                timestamp_granularities=["segment"]
+            )
+    finally:
+        # The old code leaked this file; the benchmark cleans up after itself
+        os.remove(temp_path)
+    return prepared
+
+
+async def upload_direct(chunk_path: Path) -> float:
+    """Upload the chunk file as-is, like the current path; return preparation time."""
+    started = time.perf_counter()
+    prepared = time.perf_counter() - started
+    if await transcription_service.transcribe_audio_chunk(chunk_path) is None:
+        raise RuntimeError(f"Upload of {chunk_path} failed")
+    return prepared
+
+
+async def run_mode(mode: str, url: str, chunks_dir: Path) -> dict:
+    """Upload every chunk sequentially with one path and report its costs."""
+    transcription_service.client = AsyncOpenAI(api_key="benchmark", base_url=f"{url}/v1")
+    upload = upload_pydub if mode == "pydub" else upload_direct
+    chunks = sorted(chunks_dir.glob("chunk_*.mp3"))
+
+    await upload_direct(chunks[0])  # open the connection outside the measurement
+    self_before = resource.getrusage(resource.RUSAGE_SELF)
+    children_before = resource.getrusage(resource.RUSAGE_CHILDREN)
+    started = time.perf_counter()
+    preparation = [await upload(chunk) for chunk in chunks]
+    wall = time.perf_counter() - started
+    self_after = resource.getrusage(resource.RUSAGE_SELF)
+    children_after = resource.getrusage(resource.RUSAGE_CHILDREN)
+    await transcription_service.client.close()
+
+    cpu = sum(
+        (after.ru_utime - before.ru_utime) + (after.ru_stime - before.ru_stime)
+        for before, after in ((self_before, self_after), (children_before, children_after))
+    )
+    return {
+        "mode": mode,
+        "cpu_per_chunk": cpu / len(chunks),
+        "peak_rss_mb": self_after.ru_maxrss / 1024,
+        "preparation": sum(preparation) / len(preparation),
+        "wall_per_chunk": wall / len(chunks),
+    }
+
+
+async def main(chunk_count: int, latency: float) -> None:
+    """Run each upload path in a fresh interpreter and print its costs."""
+    with tempfile.TemporaryDirectory() as work_dir:
+        chunks_dir = Path(work_dir)
+        make_chunks(chunks_dir, chunk_count)
+        async with serve(fake_whisper_app(latency)) as url:
+            print(f"{chunk_count} chunks of {CHUNK_SECONDS}s, fake Whisper latency {latency:.2f}s")
+            print(
+                f"{'path':>7} {'CPU/chunk (s)':>13} {'peak RSS (MB)':>13} "
+                f"{'prep (ms)':>9} {'wall/chunk (s)':>14}"
+            )
+            for mode in MODES:
+                # A fresh interpreter per path keeps peak RSS separate
+                process = await asyncio.create_subprocess_exec(
+                    sys.executable, "-m", "benchmarks.whisper_upload",
+                    "--mode", mode, "--url", url, "--chunks-dir", str(chunks_dir),
+                    stdout=asyncio.subprocess.PIPE
+                )
+                stdout, _ = await process.communicate()
+                if process.returncode != 0:
+                    raise SystemExit(f"{mode} run failed with code {process.returncode}")
+                result = json.loads(stdout.decode().strip().splitlines()[-1])
+                print(
+                    f"{mode:>7} {result['cpu_per_chunk']:>13.3f} {result['peak_rss_mb']:>13.1f} "
+                    f"{result['preparation'] * 1000:>9.1f} {result['wall_per_chunk']:>14.3f}"
+                )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chunks", type=int, default=10, help="Chunks to upload per path")
+    parser.add_argument("--latency", type=float, default=0.05, help="Fake Whisper latency per chunk (s)")
+    parser.add_argument("--mode", choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument("--url", help=argparse.SUPPRESS)
+    parser.add_argument("--chunks-dir", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.mode:
+        print(json.dumps(asyncio.run(run_mode(args.mode, args.url, args.chunks_dir))))
+    else:
+        asyncio.run(main(args.chunks, args.latency))
@@ -0,0 +1,13 @@
+"""Shared pytest configuration."""
+import os
+
+import pytest
+
+# Model clients are built at import time; tests never reach the real APIs
+os.environ.setdefault("XAI_API_KEY", "test")
+os.environ.setdefault("OPENAI_API_KEY", "test")
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
@@ -0,0 +1,105 @@
+"""Chunk preparation runs the real ffmpeg commands on a short generated episode."""
+import json
+import shutil
+import subprocess
+
+import pytest
+
+from app.core.config import settings
+from app.services.transcription_service import TranscriptionService
+
+pytestmark = pytest.mark.skipif(
+    shutil.which("ffmpeg") is None or shutil.which("ffprobe") is None,
+    reason="ffmpeg and ffprobe are required",
+)
+
+CHUNK_DURATION_MS = 4000
+EPISODE_SECONDS = 10
+EXPECTED_CHUNKS = 3
+
+
+def _duration(path) -> float:
+    result = subprocess.run(
+        ["ffprobe", "-v", "error", "-show_entries", "format=duration",
+         "-of", "default=noprint_wrappers=1:nokey=1", str(path)],
+        check=True, capture_output=True, text=True,
+    )
+    return float(result.stdout)
+
+
+@pytest.fixture
+def episode(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "MEDIA_DIR", tmp_path)
+    subprocess.run(
+        ["ffmpeg", "-v", "error", "-f", "lavfi",
+         "-i", f"sine=frequency=440:duration={EPISODE_SECONDS}",
+         "-ac", "1", "-b:a", "64k", str(tmp_path / "episode.mp3")],
+        check=True, capture_output=True,
+    )
+    return "episode.mp3"
+
+
+@pytest.fixture
+def service(monkeypatch):
+    service = TranscriptionService()
+    monkeypatch.setattr(service, "CHUNK_DURATION_MS", CHUNK_DURATION_MS)
+    return service
+
+
+def _assert_chunks_complete(audio_dir) -> None:
+    chunks_dir = audio_dir / "chunks"
+    assert not list(chunks_dir.glob("*.part"))
+    chunks = sorted(chunks_dir.glob("chunk_*.mp3"))
+    assert [chunk.name for chunk in chunks] == [
+        f"chunk_{i:03d}.mp3" for i in range(EXPECTED_CHUNKS)
+    ]
+    for chunk in chunks[:-1]:
+        assert _duration(chunk) == pytest.approx(CHUNK_DURATION_MS / 1000, abs=0.1)
+
+
+@pytest.mark.anyio
+async def test_full_pass(service, episode):
+    metadata = await service.prepare_audio_chunks(episode)
+
+    assert metadata is not None
+    assert metadata["status"] == "complete"
+    assert metadata["total_chunks"] == EXPECTED_CHUNKS
+    assert metadata["ready_chunks"] == EXPECTED_CHUNKS
+    _assert_chunks_complete(settings.MEDIA_DIR / "episode")
+
+
+@pytest.mark.anyio
+async def test_resume_recuts_only_missing_and_corrupt_chunks(service, episode):
+    await service.prepare_audio_chunks(episode)
+    audio_dir = settings.MEDIA_DIR / "episode"
+    chunks_dir = audio_dir / "chunks"
+    kept = (chunks_dir / "chunk_000.mp3").stat().st_mtime_ns
+
+    # An interrupted pass: one chunk missing, one truncated mid-write
+    (chunks_dir / "chunk_001.mp3").unlink()
+    with open(chunks_dir / "chunk_002.mp3", "r+b") as f:
+        f.truncate(512)
+    metadata = json.loads((audio_dir / "metadata.json").read_text())
+    metadata.update(status="preparing", ready_chunks=1)
+    (audio_dir / "metadata.json").write_text(json.dumps(metadata))
+
+    metadata = await service.prepare_audio_chunks(episode)
+
+    assert metadata["status"] == "complete"
+    assert metadata["ready_chunks"] == EXPECTED_CHUNKS
+    assert (chunks_dir / "chunk_000.mp3").stat().st_mtime_ns == kept
+    _assert_chunks_complete(audio_dir)
+    assert _duration(chunks_dir / "chunk_002.mp3") > 1.5
+
+
+@pytest.mark.anyio
+async def test_chunks_are_ready_while_preparation_runs(service, episode):
+    preparation = service.start_chunk_preparation(episode)
+
+    first = await service.wait_for_chunk(episode, 0)
+    last = await service.wait_for_chunk(episode, EXPECTED_CHUNKS - 1)
+    await preparation.task
+
+    assert first is not None and first["ready_chunks"] >= 1
+    assert last is not None and last["ready_chunks"] == EXPECTED_CHUNKS
+    assert (settings.MEDIA_DIR / "episode" / "chunks" / "chunk_000.mp3").exists()
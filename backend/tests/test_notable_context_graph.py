@@ -0,0 +1,53 @@
+"""Notable-context extraction must not block the event loop."""
+import asyncio
+import time
+
+import pytest
+
+from app.workflows.src.notable_context_graph import graph as notable
+
+LLM_LATENCY_SECONDS = 0.3
+TICK_SECONDS = 0.01
+MAX_LOOP_LAG_SECONDS = 0.1
+
+
+class SlowFakeLLM:
+    """Structured-output stand-in that takes a while to answer, sync or async."""
+
+    def invoke(self, prompt: str) -> notable.NotableStatements:
+        time.sleep(LLM_LATENCY_SECONDS)
+        return notable.NotableStatements(statements=["What study found this?"])
+
+    async def ainvoke(self, prompt: str) -> notable.NotableStatements:
+        await asyncio.sleep(LLM_LATENCY_SECONDS)
+        return notable.NotableStatements(statements=["What study found this?"])
+
+
+async def _max_loop_lag(stop: asyncio.Event) -> float:
+    """Measure the worst delay of a ticker sharing the event loop."""
+    worst = 0.0
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(TICK_SECONDS)
+        worst = max(worst, time.perf_counter() - started - TICK_SECONDS)
+    return worst
+
+
+@pytest.mark.anyio
+async def test_extraction_does_not_block_event_loop(monkeypatch):
+    monkeypatch.setattr(notable, "llm", SlowFakeLLM())
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(_max_loop_lag(stop))
+
+    started = time.perf_counter()
+    results = await asyncio.gather(
+        *(notable.graph.ainvoke({"transcript": f"Transcript {i}"}) for i in range(3))
+    )
+    elapsed = time.perf_counter() - started
+    stop.set()
+    lag = await ticker
+
+    assert all(result["notable_context"] == ["What study found this?"] for result in results)
+    assert lag < MAX_LOOP_LAG_SECONDS, f"event loop blocked for {lag:.3f}s"
+    # Extractions overlap instead of running back to back
+    assert elapsed < 2 * LLM_LATENCY_SECONDS
@@ -0,0 +1,84 @@
+"""Chunk preparation around the episode lock and resumed passes."""
+import asyncio
+import json
+
+import pytest
+
+from app.core.config import settings
+from app.services.ffmpeg_scheduler import PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE
+from app.services.transcription_service import TranscriptionService
+from app.utils.file_lock import try_lock, unlock
+
+FAILED = {
+    "total_chunks": 3,
+    "chunk_duration_seconds": 120.0,
+    "total_duration_seconds": 300.0,
+    "chunk_duration_ms": 120000,
+    "created_at": "2025-01-01T00:00:00",
+    "status": "failed",
+    "ready_chunks": 1,
+}
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "MEDIA_DIR", tmp_path)
+    service = TranscriptionService()
+    monkeypatch.setattr(service, "CHUNK_READY_POLL_SECONDS", 0.01)
+    return service
+
+
+@pytest.fixture
+def audio_dir(tmp_path):
+    (tmp_path / "episode.mp3").write_bytes(b"\0" * 1024)
+    audio_dir = tmp_path / "episode"
+    (audio_dir / "chunks").mkdir(parents=True)
+    (audio_dir / "metadata.json").write_text(json.dumps(FAILED))
+    return audio_dir
+
+
+@pytest.mark.anyio
+async def test_stale_failure_is_not_final_while_lock_is_held(service, audio_dir):
+    lock_fd = try_lock(audio_dir / ".prepare.lock")  # a retry elsewhere
+    follower = asyncio.create_task(service.prepare_audio_chunks("episode.mp3"))
+    await asyncio.sleep(0.1)
+    assert not follower.done()
+
+    complete = {**FAILED, "status": "complete", "ready_chunks": 3}
+    (audio_dir / "metadata.json").write_text(json.dumps(complete))
+    unlock(lock_fd)
+
+    assert await follower == complete
+
+
+@pytest.mark.anyio
+async def test_failure_is_final_once_lock_is_free(service, audio_dir):
+    lock_fd = try_lock(audio_dir / ".prepare.lock")
+    follower = asyncio.create_task(service.prepare_audio_chunks("episode.mp3"))
+    await asyncio.sleep(0.1)
+    unlock(lock_fd)
+
+    assert await follower is None
+    # The follower reported the failure without starting a retry of its own
+    assert json.loads((audio_dir / "metadata.json").read_text()) == FAILED
+
+
+@pytest.mark.anyio
+async def test_resume_probes_only_chunk_zero_interactively(service, audio_dir, monkeypatch):
+    for i in range(FAILED["total_chunks"]):
+        (audio_dir / "chunks" / f"chunk_{i:03d}.mp3").write_bytes(b"\0" * 1024)
+    priorities = {}
+
+    async def fake_duration(path, priority=PRIORITY_INTERACTIVE):
+        priorities[path.name] = priority
+        return FAILED["chunk_duration_seconds"]
+
+    monkeypatch.setattr(service, "_get_audio_duration", fake_duration)
+    valid = await service._find_valid_chunks(audio_dir / "chunks", FAILED, PRIORITY_INTERACTIVE)
+
+    assert valid == {0, 1, 2}
+    assert priorities == {
+        "chunk_000.mp3": PRIORITY_INTERACTIVE,
+        "chunk_001.mp3": PRIORITY_BACKGROUND,
+        "chunk_002.mp3": PRIORITY_BACKGROUND,
+    }
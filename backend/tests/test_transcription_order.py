@@ -0,0 +1,95 @@
+"""Bounded-parallel transcription starts chunks in order and yields them in order."""
+import asyncio
+import json
+import time
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.config import settings
+from app.services.transcription_service import TranscriptionService
+
+WHISPER_LATENCY_SECONDS = 0.1
+TOTAL_CHUNKS = 10
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "MEDIA_DIR", tmp_path)
+    service = TranscriptionService()
+    started = []
+
+    async def fake_transcribe(chunk_path):
+        started.append(chunk_path.name)
+        await asyncio.sleep(WHISPER_LATENCY_SECONDS)
+        return SimpleNamespace(
+            text=chunk_path.stem,
+            segments=[SimpleNamespace(start=0.0, end=1.0, text=chunk_path.stem)],
+        )
+
+    monkeypatch.setattr(service, "transcribe_audio_chunk", fake_transcribe)
+    service.started = started
+    return service
+
+
+@pytest.fixture
+def episode(tmp_path):
+    chunks_dir = tmp_path / "episode" / "chunks"
+    chunks_dir.mkdir(parents=True)
+    for i in range(TOTAL_CHUNKS):
+        (chunks_dir / f"chunk_{i:03d}.mp3").write_bytes(b"\0" * 1024)
+    (tmp_path / "episode" / "metadata.json").write_text(json.dumps({
+        "total_chunks": TOTAL_CHUNKS,
+        "chunk_duration_seconds": 120.0,
+        "total_duration_seconds": TOTAL_CHUNKS * 120.0,
+        "chunk_duration_ms": 120000,
+        "created_at": datetime.now().isoformat(),
+        "status": "complete",
+        "ready_chunks": TOTAL_CHUNKS,
+    }))
+    return "episode.mp3"
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("concurrency", [1, 4])
+async def test_first_event_arrives_after_one_whisper_call(service, episode, concurrency, monkeypatch):
+    load_cached = service._load_cached_transcript
+
+    async def reversed_cache_reads(audio_dir, chunk_index, chunking_key):
+        # Thread-pool file reads finish in any order; make later chunks win
+        await asyncio.sleep(0.005 * (TOTAL_CHUNKS - chunk_index))
+        return await load_cached(audio_dir, chunk_index, chunking_key)
+
+    monkeypatch.setattr(service, "_load_cached_transcript", reversed_cache_reads)
+    started = time.perf_counter()
+    first_event = None
+    events = []
+    async for event in service.transcribe_specific_chunks(
+        episode, 0, TOTAL_CHUNKS - 1, max_concurrency=concurrency
+    ):
+        if first_event is None:
+            first_event = time.perf_counter() - started
+        events.append(event)
+
+    assert [event["chunk_index"] for event in events] == list(range(1, TOTAL_CHUNKS + 1))
+    # Chunk 0 holds one of the first slots however the cache reads finish
+    assert "chunk_000.mp3" in service.started[:concurrency]
+    assert sorted(service.started) == [f"chunk_{i:03d}.mp3" for i in range(TOTAL_CHUNKS)]
+    assert first_event < 2 * WHISPER_LATENCY_SECONDS
+
+
+@pytest.mark.anyio
+async def test_cached_chunks_do_not_delay_uncached_ones(service, episode):
+    async for _ in service.transcribe_specific_chunks(episode, 0, 4, max_concurrency=2):
+        pass
+    service.started.clear()
+
+    events = [
+        event async for event in service.transcribe_specific_chunks(
+            episode, 0, TOTAL_CHUNKS - 1, max_concurrency=2
+        )
+    ]
+
+    assert [event["chunk_index"] for event in events] == list(range(1, TOTAL_CHUNKS + 1))
+    assert sorted(service.started) == [f"chunk_{i:03d}.mp3" for i in range(5, TOTAL_CHUNKS)]
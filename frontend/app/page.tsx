@@ -36,6 +36,13 @@ interface PodcastData {
     size_bytes: number;
     error: string | null;
   };
+  job_id: string | null;
+}
+
+interface DownloadJobSnapshot {
+  status: string;
+  audio_download: PodcastData["audio_download"] | null;
+  error: string | null;
 }
 
 interface TranscriptionChunk {
@@ -110,8 +117,13 @@ export default function Home() {
       if (!response.ok)
         throw new Error(`HTTP error! status: ${response.status}`);
 
-      const result = await response.json();
+      const result: PodcastData = await response.json();
       setData(result);
+
+      // Audio download and chunking continue in the background
+      if (result.job_id && result.audio_download.status === "pending") {
+        watchDownloadJob(result.job_id);
+      }
     } catch (err) {
       setError(err instanceof Error ? err.message : "Failed to parse RSS feed");
     } finally {
@@ -119,6 +131,73 @@ export default function Home() {
     }
   };
 
+  const watchDownloadJob = (jobId: string) => {
+    // Apply a job snapshot; returns true once the job has finished
+    const applyJob = (job: DownloadJobSnapshot): boolean => {
+      const audioDownload = job.audio_download;
+      if (audioDownload) {
+        setData((prev) =>
+          prev && prev.job_id === jobId
+            ? { ...prev, audio_download: audioDownload }
+            : prev
+        );
+      }
+
+      if (job.status === "error" && !job.audio_download) {
+        setError(job.error || "Failed to download audio");
+      }
+      return job.status === "ready" || job.status === "error";
+    };
+
+    const jobStream = new EventSource(
+      `http://localhost:8000/api/v1/podcasts/jobs/${jobId}/events`
+    );
+
+    jobStream.onmessage = (event) => {
+      if (applyJob(JSON.parse(event.data))) {
+        jobStream.close();
+      }
+    };
+
+    // EventSource reconnects dropped connections by itself and only gives up
+    // when the server refuses the stream, e.g. once the job has expired
+    jobStream.onerror = async () => {
+      if (jobStream.readyState !== EventSource.CLOSED) return;
+
+      try {
+        const response = await fetch(
+          `http://localhost:8000/api/v1/podcasts/jobs/${jobId}`
+        );
+        if (response.status === 404) {
+          setData((prev) =>
+            prev && prev.job_id === jobId
+              ? {
+                  ...prev,
+                  audio_download: {
+                    ...prev.audio_download,
+                    status: "error",
+                    error: "Download job no longer exists",
+                  },
+                }
+              : prev
+          );
+          setError("Audio download was lost. Please load the episode again.");
+          return;
+        }
+        if (!response.ok)
+          throw new Error(`HTTP error! status: ${response.status}`);
+
+        if (!applyJob(await response.json())) {
+          setTimeout(() => watchDownloadJob(jobId), 1000);
+        }
+      } catch (err) {
+        setError(
+          err instanceof Error ? err.message : "Failed to check audio download"
+        );
+      }
+    };
+  };
+
   const loadChunks = async (
     filename: string,
     startChunk: number,
@@ -222,7 +301,8 @@ export default function Home() {
   const initializeTranscription = async (filename: string) => {
     try {
       console.log("Fetching audio chunk info...");
-      const info = await getAudioChunkInfo(filename);
+      // Retry a failed preparation when the user starts playback again
+      const info = await getAudioChunkInfo(filename, transcription.error !== null);
       console.log("Audio info:", info);
 
       setTranscription((prev) => ({
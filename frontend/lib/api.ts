@@ -64,21 +64,40 @@ export async function extractNotableContext(transcript: string) {
 }
 
 export interface AudioChunkInfo {
+  status: "complete" | "preparing";
   total_chunks: number;
   chunk_duration_seconds: number;
   total_duration_seconds: number;
+  ready_chunks?: number;
 }
 
+// Resolves once the chunk layout is known. The backend answers 202 while
+// chunks are being prepared; the layout appears in it after ffprobe runs.
+// A failed preparation (422) throws; pass retry to start it again.
 export async function getAudioChunkInfo(
-  filename: string
+  filename: string,
+  retry = false
 ): Promise<AudioChunkInfo> {
-  const response = await fetch(
-    `${API_BASE_URL}/transcription/info/${filename}`
-  );
+  let query = retry ? "?retry=true" : "";
+  while (true) {
+    const response = await fetch(
+      `${API_BASE_URL}/transcription/info/${filename}${query}`
+    );
+    query = "";
 
-  if (!response.ok) {
-    throw new Error(`Failed to get audio info: ${response.statusText}`);
-  }
+    if (!response.ok) {
+      const body = await response.json().catch(() => null);
+      throw new Error(
+        body?.error ?? `Failed to get audio info: ${response.statusText}`
+      );
+    }
 
-  return response.json();
+    const info = await response.json();
+    if (response.status !== 202 || info.total_chunks !== undefined) {
+      return info;
+    }
+
+    const retryAfter = Number(response.headers.get("Retry-After") ?? "1");
+    await new Promise((resolve) => setTimeout(resolve, retryAfter * 1000));
+  }
 }